@@ -48,6 +48,8 @@ if __name__ == "__main__":
         # resource_filter=["flows", "entity_types", "webhooks", "intents"],
         # flow_include_list=['Steering'],
         # intent_include_pattern='sup'
+        # workers=4, # lint Flows and Intents in parallel processes
+        # use_cache=True, # reuse results for unchanged Flows and Intents
         output_file="logs.txt",
     )
 
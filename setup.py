@@ -15,15 +15,21 @@
 # limitations under the License.
 
 import pathlib
+import re
 from setuptools import setup, find_packages
 
 here = pathlib.Path(__file__).parent.resolve()
 
 long_description = (here / 'README.md').read_text(encoding='utf-8')
+version = re.search(
+    r'^__version__ = "([^"]+)"$',
+    (here / 'src' / 'cxlint' / '__init__.py').read_text(encoding='utf-8'),
+    re.M,
+).group(1)
 
 setup(
     name='cxlint',
-    version='1.0.4',
+    version=version,
     description='A static code analyzer that provides automated quality \
       control for Dialogflow CX Agents',
     long_description=long_description,
@@ -46,4 +52,7 @@ setup(
     packages=find_packages(where='src'),
     package_data={'': ['.cxlintrc']},
     python_requires='>=3.6, <4',
+    extras_require={
+        'fast': ['orjson'],
+    },
 )
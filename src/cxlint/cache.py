@@ -0,0 +1,233 @@
+"""Persistent cache of linter results for unchanged resource directories."""
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import time
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from cxlint import __version__
+from cxlint.common import Common
+from cxlint.resources.types import LintStats, ConfigMap
+
+CACHE_FILEPATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "cxlint", "cache.json"
+)
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 2000
+
+# (path, mtime_ns, size) of every file below a resource dir
+FileStats = Tuple[Tuple[str, int, int], ...]
+LintResult = Tuple[LintStats, List[str]]
+
+
+def scan_files(dir_path: str, suffix: str = "") -> FileStats:
+    """Stat every file below dir_path that ends with suffix."""
+    files = []
+    dirs = [dir_path]
+
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry.path)
+
+                elif entry.name.endswith(suffix):
+                    stat = entry.stat()
+                    files.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+    return tuple(sorted(files))
+
+
+def hash_files(files: FileStats) -> str:
+    """Hash the names and contents of the given files."""
+    digest = hashlib.blake2b()
+
+    for path, _, _ in files:
+        digest.update(path.encode("UTF-8"))
+
+        with open(path, "rb") as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+class LintCache:
+    """Persistent cache of the stats and log messages of resource dirs.
+
+    Entries are keyed by the resource dir and a digest of the linter settings,
+    which includes the config, the verbosity and the installed cxlint
+    version. An entry is reused when every file below the dir still has the
+    same mtime and size, or failing that, the same content hash. The content
+    hash is only computed on the first run that finds the files unchanged,
+    so a miss reads each file once, for the lint itself.
+
+    The cache file is plain JSON, so loading it can never run code.
+    """
+
+    def __init__(
+        self,
+        resource_type: str,
+        verbose: bool,
+        config: ConfigMap,
+        cache_file: str = CACHE_FILEPATH,
+    ):
+        self.cache_file = cache_file
+        self.settings_key = self.build_settings_key(
+            resource_type, verbose, config
+        )
+        self.entries = {}
+
+    @staticmethod
+    def build_settings_key(
+        resource_type: str, verbose: bool, config: ConfigMap
+    ) -> str:
+        """Digest everything besides the files that affects lint output."""
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        settings = (
+            resource_type,
+            verbose,
+            sorted((section, sorted(opts.items()))
+                   for section, opts in config.items()),
+            __version__,
+            # Reinstalling the package replaces its files, which bumps the
+            # mtime of the package dir even without a version change.
+            os.stat(package_dir).st_mtime_ns,
+        )
+
+        return hashlib.blake2b(repr(settings).encode("UTF-8")).hexdigest()
+
+    @staticmethod
+    def entry_key(settings_key: str, path: str) -> str:
+        """Build the cache file key of a resource dir."""
+        return f"{settings_key}:{os.path.abspath(path)}"
+
+    def load_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache file, starting empty if it is missing or invalid."""
+        try:
+            with open(self.cache_file, "rb") as cache_file:
+                entries = json.loads(cache_file.read())
+
+        except (OSError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def save_entries(self):
+        """Evict stale entries and write the cache file atomically."""
+        cutoff = time.time() - CACHE_TTL_SECONDS
+        fresh = sorted(
+            (item for item in self.entries.items()
+             if item[1]["last_used"] >= cutoff),
+            key=lambda item: item[1]["last_used"],
+            reverse=True,
+        )
+        self.entries = dict(fresh[:CACHE_MAX_ENTRIES])
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_file, "w", encoding="UTF-8") as cache_file:
+                json.dump(self.entries, cache_file)
+
+            os.replace(tmp_file, self.cache_file)
+
+        except OSError as err:
+            logging.warning("Unable to write lint cache: %s", err)
+
+    def lookup(self, key: str, files: FileStats):
+        """Return the cached entry for key if its files are unchanged."""
+        entry = self.entries.get(key, None)
+
+        if not isinstance(entry, dict):
+            return None
+
+        files_list = [list(file) for file in files]
+
+        if entry.get("files") == files_list:
+            # First hit since the lint, so the files still hold the linted
+            # content and can be hashed for later mtime-only changes.
+            if entry.get("digest") is None:
+                entry["digest"] = hash_files(files)
+
+            return entry
+
+        if entry.get("digest") is None or entry["digest"] != hash_files(files):
+            return None
+
+        entry["files"] = files_list
+
+        return entry
+
+    def lint_paths(
+        self,
+        paths: List[str],
+        lint_misses: Callable[[List[str]], Iterable[LintResult]],
+        console,
+    ) -> LintStats:
+        """Lint the paths missing from the cache and replay all results.
+
+        `lint_misses` receives the uncached paths and must yield the stats
+        and log messages of each one in order. Messages are replayed on the
+        `console` in the order of `paths`.
+        """
+        self.entries = self.load_entries()
+        now = time.time()
+        results = {}
+        misses = {}
+
+        for path in paths:
+            key = self.entry_key(self.settings_key, path)
+            files = scan_files(path)
+            entry = self.lookup(key, files)
+
+            if entry:
+                entry["last_used"] = now
+                results[path] = (
+                    LintStats(**entry["stats"]), entry["messages"]
+                )
+
+            else:
+                misses[path] = (key, files)
+
+        for path, result in zip(misses, lint_misses(list(misses))):
+            key, files = misses[path]
+            self.entries[key] = {
+                "files": [list(file) for file in files],
+                "digest": None,
+                "last_used": now,
+                "stats": dataclasses.asdict(result[0]),
+                "messages": result[1],
+            }
+            results[path] = result
+
+        stats = LintStats()
+
+        for path in paths:
+            path_stats, messages = results[path]
+
+            for message in messages:
+                console.log(message)
+
+            Common.merge_stats(stats, path_stats)
+
+        self.save_entries()
+
+        return stats
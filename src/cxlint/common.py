@@ -14,28 +14,123 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
+import collections
+import dataclasses
+import functools
 import os
+import pathlib
 import re
 
-from configparser import ConfigParser
-from typing import Dict, List, Union
-from cxlint.resources.types import Intent, EntityType
+from concurrent.futures import Executor, ProcessPoolExecutor
 
-# logging config
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
+
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+)
+from cxlint.resources.types import Intent, EntityType, LintStats, ConfigMap
+
+# Resource types whose path points at a file, e.g. <page>.json
+FILE_RESOURCE_TYPES = frozenset({"page", "webhook"})
+
+# Separates the items of list options in the config, e.g. "a,\n  b"
+CONFIG_LIST_SEPARATOR = re.compile(r"[,\s]+")
+
+# Resources that can be toggled with the AGENT RESOURCES include filter
+FILTERABLE_RESOURCES = (
+    "entity_types",
+    "flows",
+    "intents",
+    "test_cases",
+    "webhooks",
+)
+
+# Attribute holding the per language code files of each resource type
+LANG_CODE_FILES_ATTR = {Intent: "training_phrases", EntityType: "entities"}
+
+# Agent resource directories and their snake_case resource names
+RESOURCE_DIRS = (
+    ("flows", "flows"),
+    ("entityTypes", "entity_types"),
+    ("intents", "intents"),
+    ("testCases", "test_cases"),
+    ("webhooks", "webhooks"),
 )
 
+# Escaped characters in exported display names and their replacements
+DISPLAY_NAME_ESCAPES = {
+    "%22": '"',
+    "%23": "#",
+    "%24": "$",
+    "%26": "&",
+    "%27": "'",
+    "%28": "(",
+    "%29": ")",
+    "%2c": ",",
+    "%2f": "/",
+    "%3a": ":",
+    "%3c": "<",
+    "%3d": "=",
+    "%3e": ">",
+    "%3f": "?",
+    "%5b": "[",
+    "%5d": "]",
+    "%e2%80%9c": "“",
+    "%e2%80%9d": "”",
+}
+# Longest keys first, so a multi-byte escape like %e2%80%9c is never cut
+# short by a shorter key added to the map later.
+DISPLAY_NAME_ESCAPE_PATTERN = re.compile(
+    "|".join(
+        re.escape(key)
+        for key in sorted(DISPLAY_NAME_ESCAPES, key=len, reverse=True)
+    )
+)
+
+
+class BufferedConsole:
+    """Collects log messages so they can be replayed on the main Console.
+
+    Worker processes cannot share the rich Console of the parent process, so
+    they log into this buffer and the parent replays the messages in order.
+    """
+
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message: str):
+        """Buffer a single log message."""
+        self.messages.append(message)
+
+    def flush(self) -> List[str]:
+        """Return all buffered messages and clear the buffer."""
+        messages, self.messages = self.messages, []
+
+        return messages
+
 
 class Common:
     """Common methods and helper functions used throughout library."""
 
     @staticmethod
-    def load_naming_conventions(config: ConfigParser) -> Dict[str, str]:
+    def load_naming_conventions(config: ConfigMap) -> Dict[str, str]:
         """Loads the Naming Convention styles into a map."""
-        data = dict(config.items("NAMING CONVENTIONS"))
+        return dict(
+            Common.parse_naming_conventions(
+                tuple(config["NAMING CONVENTIONS"].items())
+            )
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def parse_naming_conventions(
+        options: Tuple[Tuple[str, str], ...]
+    ) -> Dict[str, str]:
+        """Parse the naming styles once per unique set of options."""
+        data = dict(options)
 
         for key, value in data.items():
             if value == "":
@@ -44,148 +139,212 @@ class Common:
         return data
 
     @staticmethod
-    def load_message_controls(config: ConfigParser) -> Dict[str, str]:
+    def load_message_controls(config: ConfigMap) -> Dict[str, str]:
         """Loads the config file for message control into a map."""
-        msg_list = (
-            config["MESSAGES CONTROL"]["disable"].replace("\n", "").split(",")
+        return dict(
+            Common.parse_message_controls(
+                config["MESSAGES CONTROL"]["disable"]
+            )
         )
 
-        msg_dict = {msg: False for msg in msg_list}
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def parse_message_controls(disable: str) -> Dict[str, bool]:
+        """Parse the disabled rules once per unique `disable` value."""
+        msg_list = CONFIG_LIST_SEPARATOR.split(disable)
+
+        msg_dict = {msg: False for msg in msg_list if msg}
 
         return msg_dict
 
     @staticmethod
-    def load_agent_type(config: ConfigParser) -> Dict[str, str]:
+    def load_agent_type(config: ConfigMap) -> Dict[str, str]:
         """Loads the config file for agent type."""
         agent_type = config["AGENT TYPE"]["type"]
 
         return agent_type
 
     @staticmethod
-    def load_resource_filter(config: ConfigParser) -> List[str]:
+    def load_resource_filter(config: ConfigMap) -> List[str]:
         """Loads the config file for agent resource filtering."""
-        resource_filter = (
-            config["AGENT RESOURCES"]["include"].replace("\n", "").split(",")
+        return dict(
+            Common.parse_resource_filter(config["AGENT RESOURCES"]["include"])
         )
 
-        resource_dict = {
-            "entity_types": True,
-            "flows": True,
-            "intents": True,
-            "test_cases": True,
-            "webhooks": True,
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def parse_resource_filter(include: str) -> Dict[str, bool]:
+        """Parse the included resources once per unique `include` value."""
+        resource_filter = set(CONFIG_LIST_SEPARATOR.split(include))
+        resource_filter.discard("")
+
+        # An empty filter includes every resource
+        if not resource_filter:
+            return dict.fromkeys(FILTERABLE_RESOURCES, True)
+
+        return {
+            resource: resource in resource_filter
+            for resource in FILTERABLE_RESOURCES
         }
 
-        if len(resource_filter) == 1 and resource_filter[0] == "":
-            resource_filter = None
-
-        if resource_filter:
-            for resource in resource_dict:
-                if resource not in resource_filter:
-                    resource_dict[resource] = False
-
-        return resource_dict
-
     @staticmethod
-    def load_agent_id(config: ConfigParser) -> str:
+    def load_agent_id(config: ConfigMap) -> str:
         """Loads the Agent ID from the config file if provided."""
         agent_id = config["AGENT ID"]["id"]
 
         return agent_id
 
     @staticmethod
-    def calculate_rating(total_issues: int, total_inspected: int) -> float:
-        """Calculate the final rating for the linter stats."""
-        if total_inspected > 0:
-            rating = (1 - (total_issues / total_inspected)) * 10
+    def load_json(file_path: str) -> Dict[str, Any]:
+        """Read and parse a JSON file, using orjson when it is installed."""
+        return Common.parse_json(Common.read_file(file_path))
 
-        else:
-            rating = 10
+    @staticmethod
+    def read_file(file_path: str) -> bytes:
+        """Read the raw bytes of a file."""
+        return pathlib.Path(file_path).read_bytes()
 
-        return rating
+    @staticmethod
+    def parse_json(data: bytes) -> Dict[str, Any]:
+        """Parse JSON bytes, using orjson when it is installed."""
+        return json_parser.loads(data)
+
+    @staticmethod
+    def read_files_ahead(
+        file_paths: List[str], io_pool: Executor = None, window: int = 1
+    ) -> Iterator[bytes]:
+        """Yield the bytes of each file in order, reading ahead in io_pool.
+
+        At most `window` files are being read or waiting to be consumed at
+        any time, so memory stays bounded however many files there are.
+        Only the reads run on the pool, parsing is left to the caller. Without
+        a pool, or with a single file, the files are read one at a time.
+        """
+        if io_pool is None or len(file_paths) < 2:
+            yield from map(Common.read_file, file_paths)
+            return
+
+        pending = collections.deque()
+
+        for file_path in file_paths:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+
+            pending.append(io_pool.submit(Common.read_file, file_path))
+
+        while pending:
+            yield pending.popleft().result()
+
+    @staticmethod
+    def merge_stats(stats: LintStats, other: LintStats) -> None:
+        """Add all counters from `other` onto `stats`."""
+        for stat in dataclasses.fields(stats):
+            total = getattr(stats, stat.name) + getattr(other, stat.name)
+            setattr(stats, stat.name, total)
+
+    @staticmethod
+    def lint_paths_in_processes(
+        paths: List[str],
+        worker: Callable[[str], Tuple[LintStats, List[str]]],
+        *,
+        initializer: Callable,
+        initargs: Tuple,
+        max_workers: int,
+        console,
+    ) -> LintStats:
+        """Lint each path in a process pool and reduce the results.
+
+        The `worker` must be a module level function that returns the stats
+        and the buffered log messages for a single path. Messages are replayed
+        on the `console` in the same order as a serial run would produce.
+        """
+        stats = LintStats()
+
+        for path_stats, messages in Common.map_lint_paths(
+            paths,
+            worker,
+            initializer=initializer,
+            initargs=initargs,
+            max_workers=max_workers,
+        ):
+            for message in messages:
+                console.log(message)
+
+            Common.merge_stats(stats, path_stats)
+
+        return stats
+
+    @staticmethod
+    def map_lint_paths(
+        paths: List[str],
+        worker: Callable[[str], Tuple[LintStats, List[str]]],
+        *,
+        initializer: Callable,
+        initargs: Tuple,
+        max_workers: int,
+    ) -> Iterator[Tuple[LintStats, List[str]]]:
+        """Yield the stats and buffered log messages of each path in order.
+
+        The paths are linted by `worker` in a process pool, so the linter
+        built by `initializer` only ever lives in the worker processes.
+        """
+        if not paths:
+            return
+
+        chunksize = max(1, len(paths) // (max_workers * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
+        ) as pool:
+            yield from pool.map(worker, paths, chunksize=chunksize)
+
+    @staticmethod
+    def calculate_rating(total_issues: int, total_inspected: int) -> float:
+        """Calculate the final rating for the linter stats."""
+        return (1 - (total_issues / max(total_inspected, 1))) * 10
 
     @staticmethod
     def parse_filepath(in_path: str, resource_type: str) -> str:
         """Parse file path to provide quick reference for linter log."""
+        resource_name = in_path.rsplit("/", 1)[-1]
 
-        regex_map = {
-            "flow": r".*\/flows\/([^\/]*)",
-            "page": r".*\/pages\/([^\/]*)\.",
-            "entity_type": r".*\/entityTypes\/([^\/]*)",
-            "intent": r".*\/intents\/([^\/]*)",
-            "route_group": r".*\/transitionRouteGroups\/([^\/]*)",
-            "webhook": r".*\/webhooks\/([^\/]*)\."
-        }
-        resource_name = re.match(regex_map[resource_type], in_path).groups()[0]
+        if resource_type in FILE_RESOURCE_TYPES:
+            resource_name = resource_name.rsplit(".", 1)[0]
 
         return resource_name
 
     @staticmethod
     def clean_display_name(display_name: str):
         """Replace cspecial haracters from map for the given display name."""
-        patterns = {
-            "%22": '"',
-            "%23": "#",
-            "%24": "$",
-            "%26": "&",
-            "%27": "'",
-            "%28": "(",
-            "%29": ")",
-            "%2c": ",",
-            "%2f": "/",
-            "%3a": ":",
-            "%3c": "<",
-            "%3d": "=",
-            "%3e": ">",
-            "%3f": "?",
-            "%5b": "[",
-            "%5d": "]",
-            "%e2%80%9c": "“",
-            "%e2%80%9d": "”",
-        }
-
-        for key, value in patterns.items():
-            if key in display_name:
-                display_name = display_name.replace(key, value)
+        # Most display names have nothing escaped
+        if "%" not in display_name:
+            return display_name
 
-        return display_name
+        return DISPLAY_NAME_ESCAPE_PATTERN.sub(
+            lambda match: DISPLAY_NAME_ESCAPES[match.group(0)], display_name
+        )
 
     @staticmethod
-    def load_lang_code_filter(config: ConfigParser) -> str:
+    def load_lang_code_filter(config: ConfigMap) -> Optional[FrozenSet[str]]:
         """Loads the language code filter for Intent Training Phrases."""
         lang_codes = config["INTENTS"]["language_code"]
-        lang_code_list = lang_codes.split(",")
 
-        if len(lang_code_list) == 1 and lang_code_list[0] == "":
-            lang_code_list = None
+        if not lang_codes:
+            return None
 
-        return lang_code_list
+        return frozenset(lang_codes.split(","))
 
     @staticmethod
     def get_file_based_on_lang_code_filter(
         resource: Union[Intent, EntityType], lang_code, lang_code_filter
     ) -> Union[Intent, EntityType]:
         """Gets the file if it qualifies for lang_code filter."""
-        # TODO pmarlow: Refactor for better readability
-
-        if lang_code_filter:
-            if lang_code in lang_code_filter:
-                if isinstance(resource, Intent):
-                    filename = resource.training_phrases[lang_code]["file_path"]
-
-                if isinstance(resource, EntityType):
-                    filename = resource.entities[lang_code]["file_path"]
-            else:
-                filename = None
-
-        else:
-            if isinstance(resource, Intent):
-                filename = resource.training_phrases[lang_code]["file_path"]
+        if lang_code_filter and lang_code not in lang_code_filter:
+            return None
 
-            if isinstance(resource, EntityType):
-                filename = resource.entities[lang_code]["file_path"]
+        lang_files = getattr(resource, LANG_CODE_FILES_ATTR[type(resource)])
 
-        return filename
+        return lang_files[lang_code]["file_path"]
 
     @staticmethod
     def resource_precheck(
@@ -193,42 +352,29 @@ class Common:
         resource_filter: Dict[str, bool]):
         """PreLint Check to ensure the resource directory exists.
 
-        The `resources` dict uses camelCase because the file structure is in
-        camelCase. The `resource_filter` uses snake_case because the incoming
-        .cxlintrc file stores the data this way. There is some minor string
-        manipulation for resources that have 2 names to ensure we're checking
-        everything appropriately."""
-        resources = {
-            "agents": False,
-            "flows": False,
-            "entityTypes": False,
-            "intents": False,
-            "testCases": False,
-            "webhooks": False
-        }
-
-        if "agent.json" in os.listdir(agent_local_path):
-            resources["agents"] = True
-
-        # Ensure resource directories exist
-        for resource, _ in resources.items():
+        The agent directories use camelCase because the file structure is in
+        camelCase. The `resources` dict and the `resource_filter` use
+        snake_case because the incoming .cxlintrc file stores the data this
+        way, so each directory is mapped through RESOURCE_DIRS."""
+        # Stop scanning once every expected entry has been seen
+        expected = {dir_name for dir_name, _ in RESOURCE_DIRS}
+        expected.add("agent.json")
+        entries = set()
 
-            # skip cause we handle this case outside loop
-            if resource == "agents":
-                pass
+        with os.scandir(agent_local_path) as agent_dir:
+            for entry in agent_dir:
+                if entry.name in expected:
+                    entries.add(entry.name)
 
-            elif resource in os.listdir(agent_local_path):
-                resources[resource] = True
+                    if len(entries) == len(expected):
+                        break
 
-        # Clean up dict so we can use snake_case from here on
-        resources["entity_types"] = resources["entityTypes"]
-        resources["test_cases"] = resources["testCases"]
-        resources.pop("entityTypes", None)
-        resources.pop("testCases", None)
+        resources = {"agents": "agent.json" in entries}
 
         # Check against user requrest filters
-        for resource, value in resource_filter.items():
-            if not value:
-                resources[resource] = False
+        for dir_name, resource in RESOURCE_DIRS:
+            resources[resource] = (
+                dir_name in entries and resource_filter.get(resource, True)
+            )
 
         return resources
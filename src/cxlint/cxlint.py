@@ -14,14 +14,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import configparser
+import contextlib
+import functools
 import os
 import logging
+import re
 
+from types import MappingProxyType
 from rich.console import Console
+from rich.highlighter import ReprHighlighter
 from rich.logging import RichHandler
+from rich.text import Text
 
-from typing import List, Any, Union, Dict
+from typing import List, Any, Union, Dict, Mapping
 
 from cxlint.common import Common
 from cxlint.gcs_utils import GcsUtils
@@ -31,15 +36,11 @@ from cxlint.resources.flows import Flows
 from cxlint.resources.entity_types import EntityTypes
 from cxlint.resources.intents import Intents
 from cxlint.resources.test_cases import TestCases
+from cxlint.resources.types import ConfigMap
 from cxlint.resources.webhooks import Webhooks
 
-console = Console(
-    record=True,
-    log_time=False,
-    log_path=False,
-    width=200,
-    color_system="truecolor",
-)
+CONSOLE_SETTINGS = {"log_time": False, "log_path": False, "width": 200}
+console = Console(color_system="truecolor", **CONSOLE_SETTINGS)
 
 keywords = [
     "Flows Directory",
@@ -47,27 +48,139 @@ keywords = [
     "Test Cases Directory",
     "Intents Directory",
 ]
+KEYWORD_PATTERN = re.compile("|".join(re.escape(word) for word in keywords))
+
+
+class KeywordHighlighter(ReprHighlighter):
+    """Repr highlighting plus all keywords matched in a single regex pass."""
+
+    def highlight(self, text: Text):
+        super().highlight(text)
+        text.highlight_regex(KEYWORD_PATTERN, "logging.keyword")
+
+
 handler = RichHandler(
     enable_link_path=False,
-    keywords=keywords,
+    highlighter=KeywordHighlighter(),
+    keywords=[],
     show_time=False,
     show_level=False,
     show_path=False,
     tracebacks_word_wrap=False,
 )
 
-# logging config
-logging.basicConfig(
-    level=logging.INFO, format="%(message)s", handlers=[handler], force=True
-)
 
-# configparser
-config = configparser.ConfigParser()
-config.sections()
+def _configure_logging():
+    """Install the Rich log handler on the root logger once per process."""
+    if handler in logging.getLogger().handlers:
+        return
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[handler],
+        force=True,
+    )
+
+
+# .cxlintrc parsing
+ConfigSnapshot = Mapping[str, Mapping[str, str]]
+CONFIG_FILEPATH = os.path.join(os.path.dirname(__file__), ".cxlintrc")
+SECTION_PATTERN = re.compile(r"^\[(.+)\]\s*$")
+OPTION_PATTERN = re.compile(r"^([^=\s]+)\s*=\s*(.*)$")
+
+
+def _load_cxlintrc(path: str) -> ConfigSnapshot:
+    """Load the .cxlintrc file, reusing the parsed map until it changes.
+
+    The map is shared by every CxLint instance, so it is read-only and each
+    instance works on its own copy."""
+    return _parse_cxlintrc(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_cxlintrc(path: str, _mtime_ns: int) -> ConfigSnapshot:
+    """Parse the .cxlintrc file into a map of sections and options.
+
+    `_mtime_ns` is unused and only serves as part of the cache key, so edits
+    to the rcfile between runs in the same process are picked up.
+
+    Follows the configparser conventions used by the rcfile: full line `#`
+    or `;` comments, lowercase option names and indented continuation lines
+    that are appended to the previous option value."""
+    config = {}
+    section = None
+    option = None
+
+    with open(path, encoding="UTF-8") as config_file:
+        for line_num, line in enumerate(config_file, start=1):
+            stripped = line.strip()
+
+            if not stripped or stripped[0] in "#;":
+                continue
+
+            if line[0].isspace() and option:
+                config[section][option] += "\n" + stripped
+                continue
+
+            section_match = SECTION_PATTERN.match(stripped)
+            option_match = OPTION_PATTERN.match(stripped)
+
+            if section_match:
+                section = section_match.group(1)
+                config.setdefault(section, {})
+                option = None
 
-config_filepath = os.path.join(os.path.dirname(__file__), ".cxlintrc")
-with open(config_filepath, encoding="UTF-8") as config_filepath_infile:
-    config.read_file(config_filepath_infile)
+            elif option_match and section:
+                option = option_match.group(1).lower()
+                config[section][option] = option_match.group(2).strip()
+
+            else:
+                raise ValueError(
+                    f"Unable to parse {path} at line {line_num}: {stripped}"
+                )
+
+    return MappingProxyType(
+        {
+            section: MappingProxyType(options)
+            for section, options in config.items()
+        }
+    )
+
+
+class TeeConsole:
+    """Logs on the main Console and streams a copy to the output file.
+
+    Messages are written to the output file as they are logged, rather than
+    recorded in memory for the whole run and saved at the end.
+    """
+
+    def __init__(self, main_console: Console):
+        self.main_console = main_console
+        self.file_console = None
+
+    def log(self, message: str):
+        """Log a single message on every active Console."""
+        self.main_console.log(message)
+
+        if self.file_console:
+            self.file_console.log(message)
+
+    @contextlib.contextmanager
+    def stream_to(self, file_path: str):
+        """Copy all messages logged within the block to file_path."""
+        if not file_path:
+            yield
+            return
+
+        with open(file_path, "w", encoding="UTF-8") as output_file:
+            self.file_console = Console(file=output_file, **CONSOLE_SETTINGS)
+
+            try:
+                yield
+
+            finally:
+                self.file_console = None
 
 
 class CxLint:
@@ -90,7 +203,17 @@ class CxLint:
         test_case_pattern: str = None,
         test_case_tags: Union[List[str], str] = None,
         verbose: bool = True,
+        *,
+        workers: int = 1,
+        use_cache: bool = False,
     ):
+        _configure_logging()
+
+        self.config: ConfigMap = {
+            section: dict(options)
+            for section, options in _load_cxlintrc(CONFIG_FILEPATH).items()
+        }
+
         if load_gcs:
             self.gcs = GcsUtils()
 
@@ -129,42 +252,101 @@ class CxLint:
         if test_case_tags:
             self.update_config("TEST CASE TAGS", test_case_tags)
 
-        self.resource_filter = Common.load_resource_filter(config)
+        self.resource_filter = Common.load_resource_filter(self.config)
         self.output_file = output_file
-
-        self.agents = Agents(verbose, config, console)
-        self.entity_types = EntityTypes(verbose, config, console)
-        self.intents = Intents(verbose, config, console)
-        self.flows = Flows(verbose, config, console)
-        self.test_cases = TestCases(verbose, config, console)
-        self.webhooks = Webhooks(verbose, config, console)
-
-    @staticmethod
-    def read_and_append_to_config(section: str, key: str, data: Any):
+        self.console = TeeConsole(console)
+
+        self.verbose = verbose
+        self.workers = workers
+        self.use_cache = use_cache
+
+        # Resource linters are built on first use, so resources excluded by
+        # the resource filter never load their rules.
+        self._agents = None
+        self._entity_types = None
+        self._intents = None
+        self._flows = None
+        self._test_cases = None
+        self._webhooks = None
+
+    @property
+    def agents(self) -> Agents:
+        """Agent metadata linter."""
+        if self._agents is None:
+            self._agents = Agents(self.verbose, self.config, self.console)
+
+        return self._agents
+
+    @property
+    def entity_types(self) -> EntityTypes:
+        """Entity Types linter."""
+        if self._entity_types is None:
+            self._entity_types = EntityTypes(
+                self.verbose, self.config, self.console)
+
+        return self._entity_types
+
+    @property
+    def intents(self) -> Intents:
+        """Intents linter."""
+        if self._intents is None:
+            self._intents = Intents(
+                self.verbose, self.config, self.console,
+                workers=self.workers, use_cache=self.use_cache)
+
+        return self._intents
+
+    @property
+    def flows(self) -> Flows:
+        """Flows linter."""
+        if self._flows is None:
+            self._flows = Flows(
+                self.verbose, self.config, self.console,
+                workers=self.workers, use_cache=self.use_cache)
+
+        return self._flows
+
+    @property
+    def test_cases(self) -> TestCases:
+        """Test Cases linter."""
+        if self._test_cases is None:
+            self._test_cases = TestCases(
+                self.verbose, self.config, self.console)
+
+        return self._test_cases
+
+    @property
+    def webhooks(self) -> Webhooks:
+        """Webhooks linter."""
+        if self._webhooks is None:
+            self._webhooks = Webhooks(
+                self.verbose, self.config, self.console)
+
+        return self._webhooks
+
+    def read_and_append_to_config(self, section: str, key: str, data: Any):
         """Reads the existing config file and appends any new data."""
-        existing_data = config[section][key]
+        existing_data = self.config[section][key]
 
         # Check for empty string from file and set to None
         if existing_data != "":
             data = existing_data + "," + data
 
-        config.set(section, key, data)
+        self.config[section][key] = data
 
     @staticmethod
     def transform_list_to_str(data: Union[List[str], str]):
         """Determine input data and parse accordingly for config update."""
-        res = data
-
-        if isinstance(data, List):
-            res = ",".join(data)
+        if isinstance(data, str):
+            return data
 
-        if not isinstance(res, str):
-            raise TypeError(
-                "Input must be one of the following formats: `str` | "
-                "List[`str`]"
-            )
+        if isinstance(data, (list, tuple)):
+            return ",".join(data)
 
-        return res
+        raise TypeError(
+            "Input must be one of the following formats: `str` | "
+            "List[`str`]"
+        )
 
     def update_naming_conventions_config(
         self, section: str, styles: Dict[str, Dict]):
@@ -175,53 +357,53 @@ class CxLint:
                 raise TypeError(
                     "Naming Convention values must be type `string`")
 
-            config.set(section, key, value)
+            self.config[section][key.lower()] = value
 
 
     def update_flows_config(self, include_pattern: str, exclude_pattern: str):
         """Handle updates to the Flow include/exclude lists."""
         if include_pattern:
             data = self.transform_list_to_str(include_pattern)
-            config.set("FLOWS", "include", data)
+            self.config["FLOWS"]["include"] = data
 
         if exclude_pattern:
             data = self.transform_list_to_str(exclude_pattern)
-            config.set("FLOWS", "exclude", data)
+            self.config["FLOWS"]["exclude"] = data
 
     def update_intent_config(self, include_pattern: str, exclude_pattern: str):
         """Handle updates to the Intent include/exclude lists."""
         if include_pattern:
-            config.set("INTENTS", "include", include_pattern)
+            self.config["INTENTS"]["include"] = include_pattern
 
         if exclude_pattern:
-            config.set("INTENTS", "exclude", exclude_pattern)
+            self.config["INTENTS"]["exclude"] = exclude_pattern
 
     def update_config(self, section: str, data: Any):
         """Update the Config file based on user provided kwargs."""
         if section == "AGENT ID":
-            config.set(section, "id", data)
+            self.config[section]["id"] = data
 
         if section == "AGENT RESOURCES":
             data = self.transform_list_to_str(data)
-            config.set(section, "include", data)
+            self.config[section]["include"] = data
 
         if section == "AGENT TYPE":
-            config.set(section, "type", data)
+            self.config[section]["type"] = data
 
         if section == "INTENTS":
             data = self.transform_list_to_str(data)
-            config.set(section, "language_code", data)
+            self.config[section]["language_code"] = data
 
         if section == "MESSAGES CONTROL":
             data = self.transform_list_to_str(data)
-            config.set(section, "disable", data)
+            self.config[section]["disable"] = data
 
         if section == "TEST CASE TAGS":
             data = self.transform_list_to_str(data)
             self.read_and_append_to_config(section, "include", data)
 
         if section == "TEST CASE DISPLAY NAME PATTERN":
-            config.set(section, "pattern", data)
+            self.config[section]["pattern"] = data
 
     def lint_agent(self, agent_local_path: str):
         """Linting the entire CX Agent and all resource directories."""
@@ -229,8 +411,13 @@ class CxLint:
         # with open(agent_file, 'r', encoding='UTF-8') as agent_data:
         #     data = json.load(agent_data)
 
+        with self.console.stream_to(self.output_file):
+            self.lint_agent_resources(agent_local_path)
+
+    def lint_agent_resources(self, agent_local_path: str):
+        """Lint each resource directory included by the resource filter."""
         start_message = f'{"=" * 5} LINTING AGENT {"=" * 5}\n'
-        console.log(start_message)
+        self.console.log(start_message)
         resources = Common.resource_precheck(
             agent_local_path, self.resource_filter)
 
@@ -251,6 +438,3 @@ class CxLint:
 
         if resources["webhooks"]:
             self.webhooks.lint_webhooks_directory(agent_local_path)
-
-        if self.output_file:
-            console.save_text(self.output_file)
@@ -14,16 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from configparser import ConfigParser
-
 from cxlint.common import Common
-
+from cxlint.resources.types import ConfigMap
 
 
 class Agents:
     """Agent Metadata linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.config = config
@@ -14,20 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import os
 
-from configparser import ConfigParser
 
 from cxlint.common import Common
 from cxlint.rules.entity_types import EntityTypeRules
-from cxlint.resources.types import EntityType, LintStats
+from cxlint.resources.types import EntityType, LintStats, ConfigMap
 
 
 class EntityTypes:
     """Entity Type linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.config = config
@@ -50,11 +48,12 @@ class EntityTypes:
         """
         root_dir = agent_local_path + "/entityTypes"
 
-        entity_type_paths = []
-
-        for entity_type_dir in os.listdir(root_dir):
-            entity_type_dir_path = f"{root_dir}/{entity_type_dir}"
-            entity_type_paths.append(entity_type_dir_path)
+        with os.scandir(root_dir) as entries:
+            entity_type_paths = [
+                f"{root_dir}/{entity_type_dir.name}"
+                for entity_type_dir in entries
+                if entity_type_dir.is_dir()
+            ]
 
         return entity_type_paths
 
@@ -68,22 +67,21 @@ class EntityTypes:
         """
         root_dir = etype.dir_path + "/entities"
 
-        for lang_file in os.listdir(root_dir):
-            lang_code = lang_file.split(".")[0]
-            lang_code_path = f"{root_dir}/{lang_file}"
-            etype.entities[lang_code] = {"file_path": lang_code_path}
+        with os.scandir(root_dir) as entries:
+            for lang_file in entries:
+                lang_code = lang_file.name.split(".")[0]
+                etype.entities[lang_code] = {
+                    "file_path": f"{root_dir}/{lang_file.name}"
+                }
 
     @staticmethod
     def gather_entity_type_metadata(etype: EntityType):
         """Extract metadata for Entity Type for later processing."""
         metadata_file = etype.dir_path + f"/{etype.display_name}.json"
 
-        with open(metadata_file, "r", encoding="UTF-8") as etype_file:
-            etype.data = json.load(etype_file)
-            etype.resource_id = etype.data.get("name", None)
-            etype.kind = etype.data.get("kind", None)
-
-            etype_file.close()
+        etype.data = Common.load_json(metadata_file)
+        etype.resource_id = etype.data.get("name", None)
+        etype.kind = etype.data.get("kind", None)
 
     def lint_language_codes(self, etype: EntityType, stats: LintStats):
         """Executes all Entity based linter rules."""
@@ -94,30 +92,22 @@ class EntityTypes:
             )
 
             if ent_file_path:
-                with open(ent_file_path, "r", encoding="UTF-8") as ent_file:
-                    data = json.load(ent_file)
-                    entities = data.get("entities", None)
-                    etype.entities[lang_code]["entities"] = entities
-
-                    stats = self.rules.run_entity_type_rules(
-                        etype, lang_code, stats)
+                data = Common.load_json(ent_file_path)
+                entities = data.get("entities", None)
+                etype.entities[lang_code]["entities"] = entities
 
-                    ent_file.close()
-
-        return stats
+                self.rules.run_entity_type_rules(etype, lang_code, stats)
 
     def lint_entities(self, etype: EntityType, stats: LintStats):
         """Lint the Entity files inside of an Entity Type."""
-        if "entities" in os.listdir(etype.dir_path):
+        if os.path.isdir(etype.dir_path + "/entities"):
             self.build_lang_code_paths(etype)
-            stats = self.lint_language_codes(etype, stats)
+            self.lint_language_codes(etype, stats)
 
         else:
             pass
             # TODO pmarlow: Add rule for Entity Type missing Entities
 
-        return stats
-
     def lint_entity_type(self, etype: EntityType, stats: LintStats):
         """Lint a Single Entity Type dir and all subdirectories."""
 
@@ -126,9 +116,7 @@ class EntityTypes:
         )
 
         self.gather_entity_type_metadata(etype)
-        stats = self.lint_entities(etype, stats)
-
-        return stats
+        self.lint_entities(etype, stats)
 
     def lint_entity_types_directory(self, agent_local_path: str):
         """Linting the Entity Types dir in the JSON Package structure."""
@@ -149,7 +137,7 @@ class EntityTypes:
             etype.dir_path = entity_type_path
             etype.naming_pattern = self.naming_conventions.get(
                 "entity_type_name", None)
-            stats = self.lint_entity_type(etype, stats)
+            self.lint_entity_type(etype, stats)
 
         header = "-" * 20
         rating = Common.calculate_rating(
@@ -14,30 +14,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import functools
 import os
+import sys
 
-from configparser import ConfigParser
-from typing import List
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Iterator, List
 
-from cxlint.common import Common
+from cxlint.cache import LintCache, LintResult
+from cxlint.common import BufferedConsole, Common
 from cxlint.rules.flows import FlowRules
 from cxlint.rules.pages import PageRules
 
 from cxlint.graph import Graph
-from cxlint.resources.types import Flow, Page, LintStats
+from cxlint.resources.types import Flow, Page, LintStats, ConfigMap
 from cxlint.resources.pages import Pages
 from cxlint.resources.routes import Fulfillments
 from cxlint.resources.route_groups import RouteGroups
 
+# Max number of Flow and Page files read ahead of the Flow being linted.
+FILE_READ_WORKERS = 16
+
 
 class Flows:
     """Flow linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(
+        self,
+        verbose: bool,
+        config: ConfigMap,
+        console,
+        *,
+        workers: int = 1,
+        use_cache: bool = False,
+    ):
         self.verbose = verbose
         self.console = console
         self.config = config
+        self.workers = workers
+        self.cache = None
+
+        if use_cache:
+            self.cache = LintCache("flows", verbose, config)
         self.agent_id = Common.load_agent_id(config)
         self.agent_type = Common.load_agent_type(config)
         self.disable_map = Common.load_message_controls(config)
@@ -64,14 +82,14 @@ class Flows:
 
 
     @staticmethod
-    def load_include_filter(config: ConfigParser) -> str:
+    def load_include_filter(config: ConfigMap) -> str:
         """Loads the include pattern for Flow display names."""
         pattern = config["FLOWS"]["include"]
 
         return pattern
 
     @staticmethod
-    def load_exclude_filter(config: ConfigParser) -> str:
+    def load_exclude_filter(config: ConfigMap) -> str:
         """Loads the exclude pattern for Flow display names."""
         pattern = config["FLOWS"]["exclude"]
 
@@ -94,11 +112,11 @@ class Flows:
         """
         root_dir = agent_local_path + "/flows"
 
-        flow_paths = []
-
-        for flow_dir in os.listdir(root_dir):
-            flow_dir_path = f"{root_dir}/{flow_dir}"
-            flow_paths.append(flow_dir_path)
+        with os.scandir(root_dir) as entries:
+            flow_paths = [
+                f"{root_dir}/{flow_dir.name}" for flow_dir in entries
+                if flow_dir.is_dir()
+            ]
 
         return flow_paths
 
@@ -262,42 +280,58 @@ class Flows:
 
         return flow
 
-    def lint_start_page(self, flow: Flow, stats: LintStats):
-        """Process a single Flow Path file."""
-        with open(flow.start_page_file, "r", encoding="UTF-8") as flow_file:
-            page = Page(flow=flow)
-            page.display_name = "Start Page"
+    def lint_start_page(
+        self, flow: Flow, stats: LintStats, data: bytes = None):
+        """Process a single Flow Path file.
 
-            flow.graph.add_node(page.display_name)
+        `data` holds the raw bytes of the Flow file if they were read ahead.
+        """
+        page = Page(flow=flow)
+        page.display_name = "Start Page"
 
-            page.data = json.load(flow_file)
-            page.verbose = self.verbose
-            page.events = page.data.get("eventHandlers", None)
-            page.routes = page.data.get("transitionRoutes", None)
-            page.route_groups = page.data.get("transitionRouteGroups", None)
+        flow.graph.add_node(page.display_name)
 
-            flow.resource_id = page.data.get("name", None)
-            page.agent_id = flow.agent_id
-            page.resource_id = "START_PAGE"
-            flow.data[page.display_name] = page.resource_id
+        if data is None:
+            data = Common.read_file(flow.start_page_file)
 
-            # Order of linting is important
-            stats = self.routes.lint_routes(page, stats)
-            stats = self.routes.lint_events(page, stats)
+        page.data = Common.parse_json(data)
+        page.verbose = self.verbose
+        page.events = page.data.get("eventHandlers", None)
+        page.routes = page.data.get("transitionRoutes", None)
+        page.route_groups = page.data.get("transitionRouteGroups", None)
 
-            if page.route_groups:
-                page = self.routes.set_route_group_targets(page)
+        flow.resource_id = page.data.get("name", None)
+        page.agent_id = flow.agent_id
+        page.resource_id = "START_PAGE"
+        flow.data[page.display_name] = page.resource_id
 
-            stats = self.page_rules.run_page_rules(page, stats)
+        # Nothing downstream reads the raw Start Page JSON
+        page.data = None
 
-            flow_file.close()
+        # Order of linting is important
+        self.routes.lint_routes_and_events(page, stats)
 
-        return stats
+        if page.route_groups:
+            page = self.routes.set_route_group_targets(page)
+
+        self.page_rules.run_page_rules(page, stats)
+
+    @staticmethod
+    def list_sub_dirs(flow_path: str) -> set:
+        """List the resource dirs of a Flow, e.g. pages."""
+        with os.scandir(flow_path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
 
-    def lint_flow(self, flow: Flow, stats: LintStats):
-        """Lint a Single Flow dir and all subdirectories."""
+    def lint_flow(
+        self, flow: Flow, stats: LintStats, io_pool: Executor = None):
+        """Lint a Single Flow dir and all subdirectories.
+
+        The Flow file and the Page files are read ahead in `io_pool`, if
+        given, while the Start Page and Pages are parsed and linted in order.
+        """
         flow.file_name = Common.parse_filepath(flow.dir_path, "flow")
-        flow.display_name = Common.clean_display_name(flow.file_name)
+        flow.display_name = sys.intern(
+            Common.clean_display_name(flow.file_name))
         flow = self.check_flow_filters(flow)
 
         if not flow.filtered:
@@ -305,20 +339,60 @@ class Flows:
             self.console.log(message)
 
             flow.start_page_file = f"{flow.dir_path}/{flow.file_name}.json"
+            flow.sub_dirs = self.list_sub_dirs(flow.dir_path)
+
+            page_paths = []
+
+            if "pages" in flow.sub_dirs:
+                page_paths = self.pages.build_page_path_list(flow.dir_path)
+
+            file_bytes = Common.read_files_ahead(
+                [flow.start_page_file] + page_paths,
+                io_pool,
+                FILE_READ_WORKERS,
+            )
 
-            stats = self.lint_start_page(flow, stats)
-            stats = self.pages.lint_pages_directory(flow, stats)
-            stats = self.rgs.lint_route_groups_directory(flow, stats)
+            self.lint_start_page(flow, stats, next(file_bytes))
+            self.pages.lint_pages(flow, stats, page_paths, file_bytes)
+            self.rgs.lint_route_groups_directory(flow, stats)
 
             # Order of Find Operations is important here!
             flow = self.find_unused_pages(flow)
             flow = self.find_dangling_pages(flow)
             flow = self.find_unreachable_pages(flow)
 
-            stats = self.rules.run_flow_rules(flow, stats)
+            self.rules.run_flow_rules(flow, stats)
+
+    def lint_flow_path(
+        self, flow_path: str, io_pool: Executor = None) -> LintStats:
+        """Lint a single Flow dir path and return the stats for that Flow."""
+        flow = Flow()
+        flow.graph = Graph()
+        flow.verbose = self.verbose
+        flow.agent_id = self.agent_id
+        flow.dir_path = flow_path
+        flow.naming_pattern = self.naming_conventions.get("flow_name", None)
+
+        stats = LintStats()
+        self.lint_flow(flow, stats, io_pool)
 
         return stats
 
+    def lint_flow_paths_buffered(
+        self, flow_paths: List[str]) -> Iterator[LintResult]:
+        """Yield the stats and log messages of each Flow dir in order.
+
+        The Flows are linted in this process by a copy of the linter that
+        buffers its messages, so they can be cached along with the stats.
+        """
+        flows = Flows(self.verbose, self.config, BufferedConsole())
+
+        with ThreadPoolExecutor(max_workers=FILE_READ_WORKERS) as io_pool:
+            for flow_path in flow_paths:
+                stats = flows.lint_flow_path(flow_path, io_pool)
+
+                yield stats, flows.console.flush()
+
     def lint_flows_directory(self, agent_local_path: str):
         """Linting the top level Flows dir in the JSON Package structure.
 
@@ -335,21 +409,43 @@ class Flows:
         start_message = f'{"#" * 10} Begin Flows Directory Linter'
         self.console.log(start_message)
 
-        stats = LintStats()
-
         # Create a list of all Flow paths to iter through
         flow_paths = self.build_flow_path_list(agent_local_path)
-        stats.total_flows = len(flow_paths)
 
         # linting happens here
-        for flow_path in flow_paths:
-            flow = Flow()
-            flow.graph = Graph()
-            flow.verbose = self.verbose
-            flow.agent_id = self.agent_id
-            flow.dir_path = flow_path
-            flow.naming_pattern = self.naming_conventions.get("flow_name", None)
-            stats = self.lint_flow(flow, stats)
+        if self.cache:
+            lint_misses = self.lint_flow_paths_buffered
+
+            if self.workers > 1:
+                lint_misses = functools.partial(
+                    Common.map_lint_paths,
+                    worker=_lint_flow_worker,
+                    initializer=_init_flows_worker,
+                    initargs=(self.verbose, self.config),
+                    max_workers=self.workers,
+                )
+
+            stats = self.cache.lint_paths(
+                flow_paths, lint_misses, self.console)
+
+        elif self.workers > 1:
+            stats = Common.lint_paths_in_processes(
+                flow_paths,
+                _lint_flow_worker,
+                initializer=_init_flows_worker,
+                initargs=(self.verbose, self.config),
+                max_workers=self.workers,
+                console=self.console,
+            )
+
+        else:
+            stats = LintStats()
+            with ThreadPoolExecutor(max_workers=FILE_READ_WORKERS) as io_pool:
+                for flow_path in flow_paths:
+                    Common.merge_stats(
+                        stats, self.lint_flow_path(flow_path, io_pool))
+
+        stats.total_flows = len(flow_paths)
 
         header = "-" * 20
         rating = Common.calculate_rating(
@@ -363,3 +459,20 @@ class Flows:
             f"\nYour Agent Flows rated at {rating:.2f}/10\n\n"
         )
         self.console.log(end_message)
+
+
+# Flows linter owned by each worker process of the parallel Flows linter.
+_WORKER_FLOWS = None
+
+
+def _init_flows_worker(verbose: bool, config: ConfigMap):
+    """Build the Flows linter once per worker process."""
+    global _WORKER_FLOWS
+    _WORKER_FLOWS = Flows(verbose, config, BufferedConsole())
+
+
+def _lint_flow_worker(flow_path: str):
+    """Lint a single Flow dir and return its stats and log messages."""
+    stats = _WORKER_FLOWS.lint_flow_path(flow_path)
+
+    return stats, _WORKER_FLOWS.console.flush()
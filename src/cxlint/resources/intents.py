@@ -14,23 +14,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import functools
 import os
 
-from typing import Dict
-from configparser import ConfigParser
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Iterator, List
 
-from cxlint.common import Common
+from cxlint.cache import LintCache, LintResult
+from cxlint.common import BufferedConsole, Common
 from cxlint.rules.intents import IntentRules
-from cxlint.resources.types import Intent, LintStats
+from cxlint.resources.types import Intent, LintStats, ConfigMap
+
+# Max number of Training Phrase files read ahead of the Intent being linted.
+TP_READ_WORKERS = 16
 
 
 class Intents:
     """Intent linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(
+        self,
+        verbose: bool,
+        config: ConfigMap,
+        console,
+        *,
+        workers: int = 1,
+        use_cache: bool = False,
+    ):
         self.verbose = verbose
         self.console = console
+        self.config = config
+        self.workers = workers
+        self.cache = None
+
+        if use_cache:
+            self.cache = LintCache("intents", verbose, config)
         self.agent_id = Common.load_agent_id(config)
         self.disable_map = Common.load_message_controls(config)
         self.lang_code_filter = Common.load_lang_code_filter(config)
@@ -54,14 +72,14 @@ class Intents:
         return intent
 
     @staticmethod
-    def load_include_filter(config: ConfigParser) -> str:
+    def load_include_filter(config: ConfigMap) -> str:
         """Loads the include pattern for Intent display names."""
         pattern = config["INTENTS"]["include"]
 
         return pattern
 
     @staticmethod
-    def load_exclude_filter(config: ConfigParser) -> str:
+    def load_exclude_filter(config: ConfigMap) -> str:
         """Loads the exclude pattern for Intent display names."""
         pattern = config["INTENTS"]["exclude"]
 
@@ -89,10 +107,12 @@ class Intents:
         """
         root_dir = intent.dir_path + "/trainingPhrases"
 
-        for lang_file in os.listdir(root_dir):
-            lang_code = lang_file.split(".")[0]
-            lang_code_path = f"{root_dir}/{lang_file}"
-            intent.training_phrases[lang_code] = {"file_path": lang_code_path}
+        with os.scandir(root_dir) as entries:
+            for lang_file in entries:
+                lang_code = lang_file.name.split(".")[0]
+                intent.training_phrases[lang_code] = {
+                    "file_path": f"{root_dir}/{lang_file.name}"
+                }
 
     @staticmethod
     def build_intent_path_list(agent_local_path: str):
@@ -107,11 +127,11 @@ class Intents:
         """
         root_dir = agent_local_path + "/intents"
 
-        intent_paths = []
-
-        for intent_dir in os.listdir(root_dir):
-            intent_dir_path = f"{root_dir}/{intent_dir}"
-            intent_paths.append(intent_dir_path)
+        with os.scandir(root_dir) as entries:
+            intent_paths = [
+                f"{root_dir}/{intent_dir.name}" for intent_dir in entries
+                if intent_dir.is_dir()
+            ]
 
         return intent_paths
 
@@ -135,65 +155,96 @@ class Intents:
         intent.metadata_file = f"{intent.dir_path}/{intent.display_name}.json"
 
         try:
-            with open(intent.metadata_file, "r", encoding="UTF-8") as meta_file:
-                intent.data = json.load(meta_file)
-                intent.resource_id = intent.data.get("name", None)
-                intent.labels = intent.data.get("labels", None)
-                intent.description = intent.data.get("description", None)
-
-                # TODO: Linting rules for Intent Metadata
+            intent.data = Common.load_json(intent.metadata_file)
+            intent.resource_id = intent.data.get("name", None)
+            intent.labels = intent.data.get("labels", None)
+            intent.description = intent.data.get("description", None)
 
-                meta_file.close()
+            # TODO: Linting rules for Intent Metadata
 
         except FileNotFoundError:
-            stats = self.rules.intent_missing_metadata(intent, stats)
+            self.rules.intent_missing_metadata(intent, stats)
 
-        return stats
+    def lint_language_codes(
+        self, intent: Intent, stats: LintStats, io_pool: Executor = None):
+        """Executes all Training Phrase based linter rules.
 
-    def lint_language_codes(self, intent: Intent, stats: LintStats):
-        """Executes all Training Phrase based linter rules."""
+        Intents commonly have one file per language code, so the files are
+        read ahead in `io_pool`, if given, and parsed as they are linted.
+        """
+        records = []
+        tp_files = []
 
-        for lang_code in intent.training_phrases:
+        for lang_code, record in intent.training_phrases.items():
             tp_file = Common.get_file_based_on_lang_code_filter(
                 intent, lang_code, self.lang_code_filter
             )
 
             if tp_file:
-                with open(tp_file, "r", encoding="UTF-8") as tps:
-                    data = json.load(tps)
-                    phrases = data.get("trainingPhrases", None)
-                    intent.training_phrases[lang_code]["tps"] = phrases
+                records.append((lang_code, record))
+                tp_files.append(tp_file)
 
-                    stats = self.rules.run_training_phrase_rules(
-                        intent, lang_code, stats)
+        tp_bytes = Common.read_files_ahead(
+            tp_files, io_pool, TP_READ_WORKERS)
 
-                    tps.close()
+        for (lang_code, record), data in zip(records, tp_bytes):
+            record["tps"] = Common.parse_json(data).get(
+                "trainingPhrases", None)
 
-        return stats
+            self.rules.run_training_phrase_rules(
+                intent, lang_code, stats)
 
-    def lint_training_phrases(self, intent: Intent, stats: LintStats):
+    def lint_training_phrases(
+        self, intent: Intent, stats: LintStats, io_pool: Executor = None):
         """Lint the Training Phrase dir for a single Intent."""
-        if "trainingPhrases" in os.listdir(intent.dir_path):
+        if os.path.isdir(intent.dir_path + "/trainingPhrases"):
             self.build_lang_code_paths(intent)
-            stats = self.lint_language_codes(intent, stats)
+            self.lint_language_codes(intent, stats, io_pool)
 
         else:
-            stats = self.rules.missing_training_phrases(intent, stats)
+            self.rules.missing_training_phrases(intent, stats)
 
-        return stats
-
-    def lint_intent(self, intent: Intent, stats: LintStats):
+    def lint_intent(
+        self, intent: Intent, stats: LintStats, io_pool: Executor = None):
         """Lint a single Intent directory and associated files."""
         intent.display_name = Common.parse_filepath(intent.dir_path, "intent")
         intent = self.check_intent_filters(intent)
 
         if not intent.filtered:
             stats.total_intents += 1
-            stats = self.lint_intent_metadata(intent, stats)
-            stats = self.lint_training_phrases(intent, stats)
+            self.lint_intent_metadata(intent, stats)
+            self.lint_training_phrases(intent, stats, io_pool)
+
+    def lint_intent_path(
+        self, intent_path: str, io_pool: Executor = None) -> LintStats:
+        """Lint a single Intent dir path and return the stats for it."""
+        intent = Intent()
+        intent.verbose = self.verbose
+        intent.agent_id = self.agent_id
+        intent.dir_path = intent_path
+
+        intent = self.load_naming_conventions(intent, self.naming_conventions)
+
+        stats = LintStats()
+        self.lint_intent(intent, stats, io_pool)
 
         return stats
 
+    def lint_intent_paths_buffered(
+        self, intent_paths: List[str]) -> Iterator[LintResult]:
+        """Yield the stats and log messages of each Intent dir in order.
+
+        The Intents are linted in this process by a copy of the linter that
+        buffers its messages, so they can be cached along with the stats.
+        """
+        intents = Intents(self.verbose, self.config, BufferedConsole())
+
+        with ThreadPoolExecutor(max_workers=TP_READ_WORKERS) as io_pool:
+            for intent_path in intent_paths:
+                stats = intents.lint_intent_path(intent_path, io_pool)
+
+                yield stats, intents.console.flush()
+
     def lint_intents_directory(self, agent_local_path: str):
         """Linting the top level Intents Dir in the JSON Package structure.
 
@@ -211,21 +262,41 @@ class Intents:
         start_message = f'{"#" * 10} Begin Intents Directory Linter'
         self.console.log(start_message)
 
-        stats = LintStats()
-
         # Create a list of all Intent paths to iter through
         intent_paths = self.build_intent_path_list(agent_local_path)
 
         # Linting Starts Here
-        for intent_path in intent_paths:
-            intent = Intent()
-            intent.verbose = self.verbose
-            intent.agent_id = self.agent_id
-            intent.dir_path = intent_path
+        if self.cache:
+            lint_misses = self.lint_intent_paths_buffered
+
+            if self.workers > 1:
+                lint_misses = functools.partial(
+                    Common.map_lint_paths,
+                    worker=_lint_intent_worker,
+                    initializer=_init_intents_worker,
+                    initargs=(self.verbose, self.config),
+                    max_workers=self.workers,
+                )
+
+            stats = self.cache.lint_paths(
+                intent_paths, lint_misses, self.console)
+
+        elif self.workers > 1:
+            stats = Common.lint_paths_in_processes(
+                intent_paths,
+                _lint_intent_worker,
+                initializer=_init_intents_worker,
+                initargs=(self.verbose, self.config),
+                max_workers=self.workers,
+                console=self.console,
+            )
 
-            intent = self.load_naming_conventions(
-                intent, self.naming_conventions)
-            stats = self.lint_intent(intent, stats)
+        else:
+            stats = LintStats()
+            with ThreadPoolExecutor(max_workers=TP_READ_WORKERS) as io_pool:
+                for intent_path in intent_paths:
+                    Common.merge_stats(
+                        stats, self.lint_intent_path(intent_path, io_pool))
 
         header = "-" * 20
         rating = Common.calculate_rating(
@@ -239,3 +310,20 @@ class Intents:
             f"\nYour Agent Intents rated at {rating:.2f}/10\n\n"
         )
         self.console.log(end_message)
+
+
+# Intents linter owned by each worker process of the parallel Intents linter.
+_WORKER_INTENTS = None
+
+
+def _init_intents_worker(verbose: bool, config: ConfigMap):
+    """Build the Intents linter once per worker process."""
+    global _WORKER_INTENTS
+    _WORKER_INTENTS = Intents(verbose, config, BufferedConsole())
+
+
+def _lint_intent_worker(intent_path: str):
+    """Lint a single Intent dir and return its stats and log messages."""
+    stats = _WORKER_INTENTS.lint_intent_path(intent_path)
+
+    return stats, _WORKER_INTENTS.console.flush()
@@ -14,22 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import os
+import sys
 
-from configparser import ConfigParser
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, List
 
 from cxlint.common import Common
 from cxlint.rules.pages import PageRules
-from cxlint.resources.types import Flow, Page, LintStats, FormParameter
+from cxlint.resources.types import (
+    Flow, Page, LintStats, FormParameter, ConfigMap)
 from cxlint.resources.routes import Fulfillments
 
 
 class Pages:
     """Pages linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.config = config
@@ -58,11 +58,11 @@ class Pages:
         """
         pages_path = f"{flow_path}/pages"
 
-        page_paths = []
-
-        for page in os.listdir(pages_path):
-            page_file_path = f"{pages_path}/{page}"
-            page_paths.append(page_file_path)
+        with os.scandir(pages_path) as entries:
+            page_paths = [
+                f"{pages_path}/{page.name}" for page in entries
+                if page.is_file()
+            ]
 
         return page_paths
 
@@ -95,15 +95,13 @@ class Pages:
         if parameters:
             for param in parameters:
                 fp = self.get_form_parameter_data(param, page)
-                stats = self.routes.lint_reprompt_handlers(fp, stats)
-
-        return stats
-
+                self.routes.lint_reprompt_handlers(fp, stats)
 
     def lint_page(self, page: Page, stats: LintStats):
         """Lint a Single Page file."""
         page.display_name = Common.parse_filepath(page.page_file, "page")
-        page.display_name = Common.clean_display_name(page.display_name)
+        page.display_name = sys.intern(
+            Common.clean_display_name(page.display_name))
 
         page.flow.graph.add_node(page.display_name)
 
@@ -113,51 +111,49 @@ class Pages:
         # Need to implement a parser for symbol translation.
         page.flow.all_pages.add(page.display_name)
 
-        with open(page.page_file, "r", encoding="UTF-8") as page_file:
-            page.data = json.load(page_file)
-            page.verbose = self.verbose
-            page.entry = page.data.get("entryFulfillment", None)
-            page.events = page.data.get("eventHandlers", None)
-            page.form = page.data.get("form", None)
-            page.routes = page.data.get("transitionRoutes", None)
-            page.route_groups = page.data.get("transitionRouteGroups", None)
-
-            page.resource_id = page.data.get("name", None)
-            page.flow.data[page.display_name] = page.resource_id
-
-            # Order of linting is important here
-            stats = self.routes.lint_entry(page, stats)
-            stats = self.routes.lint_routes(page, stats)
-            stats = self.routes.lint_events(page, stats)
-            stats = self.lint_form(page, stats)
-
-            if page.route_groups:
-                page = self.routes.set_route_group_targets(page)
-
-            stats = self.rules.run_page_rules(page, stats)
-
-            page_file.close()
-
-        return stats
-
-    def lint_pages_directory(self, flow: Flow, stats: LintStats):
-        """Linting the Pages dir inside a specific Flow dir.
-
-        Some Flows may not contain Pages, so we check for the existence
-        of the directory before traversing
-        """
-        if "pages" in os.listdir(flow.dir_path):
-            page_paths = self.build_page_path_list(flow.dir_path)
-
-            for page_path in page_paths:
-                page = Page(flow=flow)
-                page.agent_id = flow.agent_id
-                page.page_file = page_path
-
-                page = self.load_naming_conventions(
-                    page, self.naming_conventions)
-
-                stats.total_pages += 1
-                stats = self.lint_page(page, stats)
-
-        return stats
+        if page.data is None:
+            page.data = Common.load_json(page.page_file)
+
+        page.verbose = self.verbose
+        page.entry = page.data.get("entryFulfillment", None)
+        page.events = page.data.get("eventHandlers", None)
+        page.form = page.data.get("form", None)
+        page.routes = page.data.get("transitionRoutes", None)
+        page.route_groups = page.data.get("transitionRouteGroups", None)
+
+        page.resource_id = page.data.get("name", None)
+        page.flow.data[page.display_name] = page.resource_id
+
+        # Nothing downstream reads the raw Page JSON, so release it before
+        # the sub-resources are linted.
+        page.data = None
+
+        # Order of linting is important here
+        self.routes.lint_entry(page, stats)
+        self.routes.lint_routes_and_events(page, stats)
+        self.lint_form(page, stats)
+
+        if page.route_groups:
+            page = self.routes.set_route_group_targets(page)
+
+        self.rules.run_page_rules(page, stats)
+
+    def lint_pages(
+        self,
+        flow: Flow,
+        stats: LintStats,
+        page_paths: List[str],
+        page_bytes: Iterable[bytes],
+    ):
+        """Lint the given Page files, parsing each one as it is linted."""
+        for page_path, data in zip(page_paths, page_bytes):
+            page = Page(flow=flow)
+            page.agent_id = flow.agent_id
+            page.page_file = page_path
+            page.data = Common.parse_json(data)
+
+            page = self.load_naming_conventions(
+                page, self.naming_conventions)
+
+            stats.total_pages += 1
+            self.lint_page(page, stats)
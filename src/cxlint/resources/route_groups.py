@@ -15,20 +15,17 @@
 # limitations under the License.
 
 import os
-import json
-
-from configparser import ConfigParser
 
 from cxlint.common import Common
 
-from cxlint.resources.types import RouteGroup, Flow, LintStats
+from cxlint.resources.types import RouteGroup, Flow, LintStats, ConfigMap
 from cxlint.resources.routes import Fulfillments
 
 
 class RouteGroups:
     """Route Groups linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.config = config
@@ -53,12 +50,11 @@ class RouteGroups:
         """
         root_dir = flow_local_path + "/transitionRouteGroups"
 
-        if "transitionRouteGroups" in os.listdir(flow_local_path):
-            rg_paths = []
-
-            for rg_file in os.listdir(root_dir):
-                rg_file_path = f"{root_dir}/{rg_file}"
-                rg_paths.append(rg_file_path)
+        with os.scandir(root_dir) as entries:
+            rg_paths = [
+                f"{root_dir}/{rg_file.name}" for rg_file in entries
+                if rg_file.is_file()
+            ]
 
         return rg_paths
 
@@ -67,21 +63,17 @@ class RouteGroups:
         rg.display_name = Common.parse_filepath(rg.rg_file, "route_group")
         rg.display_name = Common.clean_display_name(rg.display_name)
 
-        with open(rg.rg_file, "r", encoding="UTF-8") as route_group_file:
-            rg.data = json.load(route_group_file)
-            rg.resource_id = rg.data.get("name", None)
-            rg.display_name = rg.data.get("displayName", None)
-            rg.routes = rg.data.get("transitionRoutes", None)
-
-            stats = self.routes.lint_routes(rg, stats)
+        rg.data = Common.load_json(rg.rg_file)
+        rg.resource_id = rg.data.get("name", None)
+        rg.display_name = rg.data.get("displayName", None)
+        rg.routes = rg.data.get("transitionRoutes", None)
+        rg.data = None
 
-            route_group_file.close()
-
-        return stats
+        self.routes.lint_routes(rg, stats)
 
     def lint_route_groups_directory(self, flow: Flow, stats: LintStats):
         """Linting Route Groups dir in the JSON Package structure."""
-        if "transitionRouteGroups" in os.listdir(flow.dir_path):
+        if "transitionRouteGroups" in flow.sub_dirs:
             # Create a list of all Route Group paths to iter through
             rg_paths = self.build_route_group_path_list(flow.dir_path)
             stats.total_route_groups = len(rg_paths)
@@ -92,6 +84,4 @@ class RouteGroups:
                 rg.verbose = self.verbose
                 rg.agent_id = self.agent_id
                 rg.rg_file = rg_path
-                stats = self.lint_route_group(rg, stats)
-
-        return stats
+                self.lint_route_group(rg, stats)
@@ -14,18 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from configparser import ConfigParser
+import itertools
+import sys
+
 from typing import Dict, Any
 
 from cxlint.common import Common
 from cxlint.rules.response_messages import ResponseMessageRules
-from cxlint.resources.types import Page, Fulfillment, LintStats, FormParameter
+from cxlint.resources.types import (
+    Page, Fulfillment, LintStats, FormParameter, ConfigMap)
+
+# Trigger type indexed by `has_intent << 1 | has_condition` for a route
+# "[]" keeps the old str([]) output for routes with no intent or condition
+TRIGGER_TYPES = ("[]", "condition", "intent", "intent+condition")
 
 
 class Fulfillments:
     """Fulfillment routes linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.config = config
@@ -35,6 +42,13 @@ class Fulfillments:
         self.rules = ResponseMessageRules(console, self.disable_map)
         self.route_parameters = {}
 
+        # Pick the trigger formatter once instead of checking per route
+        self.collect_transition_route_trigger = (
+            self._collect_verbose if verbose else self._collect_terse)
+        # Trigger strings repeat across Pages, so each is only built once
+        self.event_triggers = {}
+        self.route_triggers = {}
+
     @staticmethod
     def check_for_webhook(page: Page, path: Dict[str, Any]):
         """Check the current route for existence of webhook."""
@@ -63,41 +77,47 @@ class Fulfillments:
         ):
             route.page.has_webhook_event_handler = True
 
-    def collect_transition_route_trigger(self, route):
-        """Inspect route and return all Intent/Condition info."""
-
-        trigger = []
-        intent_name = None
+    @staticmethod
+    def _collect_terse(route):
+        """Inspect route and return its Intent/Condition trigger type."""
+        return TRIGGER_TYPES[
+            ("intent" in route.data) << 1 | ("condition" in route.data)]
 
-        if "intent" in route.data:
-            trigger.append("intent")
-            intent_name = route.data.get("intent", None)
+    @staticmethod
+    def _collect_verbose(route):
+        """Inspect route and return all Intent/Condition info."""
+        trigger = TRIGGER_TYPES[
+            ("intent" in route.data) << 1 | ("condition" in route.data)]
+        intent_name = route.data.get("intent", None)
 
-        if "condition" in route.data:
-            trigger.append("condition")
+        if intent_name:
+            return f"{trigger} : {intent_name}"
 
-        if len(trigger) > 0:
-            trigger = "+".join(trigger)
+        return trigger
 
-        if self.verbose and intent_name:
-            return f"{trigger} : {intent_name}"
+    def _event_trigger(self, route):
+        """Build the trigger info for an Event Handler."""
+        event = route.data.get("event", None)
+        trigger = self.event_triggers.get(event, None)
 
-        else:
-            return trigger
+        if trigger is None:
+            trigger = self.event_triggers[event] = f"event : {event}"
 
-    def get_trigger_info(self, route):
-        """Extract trigger info from route based on primary key."""
+        return trigger
 
-        if route.fulfillment_type == "event":
-            trigger = f"event : {route.data.get('event', None)}"
+    @staticmethod
+    def _reprompt_trigger(route):
+        """Build the trigger info for a Reprompt Event Handler."""
+        return f"{route.parameter} : event : {route.data.get('event', None)}"
 
-        if route.fulfillment_type == "reprompt_handler":
-            trigger = f"{route.parameter} : event : "\
-                f"{route.data.get('event', None)}"
+    def _route_trigger(self, route):
+        """Build the trigger info for a Transition Route."""
+        intent_condition = self.collect_transition_route_trigger(route)
+        trigger = self.route_triggers.get(intent_condition, None)
 
-        if route.fulfillment_type == "transition_route":
-            intent_condition = self.collect_transition_route_trigger(route)
+        if trigger is None:
             trigger = f"route : {intent_condition}"
+            self.route_triggers[intent_condition] = trigger
 
         return trigger
 
@@ -124,15 +144,16 @@ class Fulfillments:
         route.target_flow = route.data.get("targetFlow", None)
         route.target_page = route.data.get("targetPage", None)
 
+        # Many routes share a target, so the graph keeps one copy of each name
         if route.target_page:
-            route.page.flow.graph.add_edge(current_page, route.target_page)
-            route.page.flow.graph.add_used_node(route.target_page)
+            target_page = sys.intern(route.target_page)
+            route.page.flow.graph.add_edge(current_page, target_page)
+            route.page.flow.graph.add_used_node(target_page)
 
         if route.target_flow:
-            route.page.flow.graph.add_edge(
-                current_page, f"FLOW: {route.target_flow}"
-            )
-            route.page.flow.graph.add_used_node(f"FLOW: {route.target_flow}")
+            target_flow = sys.intern(f"FLOW: {route.target_flow}")
+            route.page.flow.graph.add_edge(current_page, target_flow)
+            route.page.flow.graph.add_used_node(target_flow)
 
         return route
 
@@ -164,25 +185,23 @@ class Fulfillments:
         self, stats: LintStats, route: Fulfillment, path: object, key: str
     ):
         """Parse through specific fulfillment types and lint."""
-        fulfillment_data = path.get(key, None)
-
-        if fulfillment_data:
-            for item in fulfillment_data:
-                # This is where each message type will exist
-                # text, custom payload, etc.
+        # Missing and empty lists are both skipped
+        for item in path.get(key, None) or ():
+            # This is where each message type will exist
+            # text, custom payload, etc.
 
-                # TODO pmarlow: create sub-method parsers per type
-                if "text" in item:
-                    for text in item["text"]["text"]:
-                        stats.total_inspected += 1
-                        route.text = text
+            # TODO pmarlow: create sub-method parsers per type
+            item_text = item.get("text", None)
 
-                        stats = self.rules.run_rm_text_rules(route, stats)
+            if item_text is not None:
+                for text in item_text["text"]:
+                    stats.total_inspected += 1
+                    route.text = text
 
-                if "parameter" in item:
-                    self.update_route_parameters(route, item)
+                    self.rules.run_rm_text_rules(route, stats)
 
-        return stats
+            if "parameter" in item:
+                self.update_route_parameters(route, item)
 
     def lint_reprompt_handlers(self, fp: FormParameter, stats: LintStats):
         """Lint for Reprompt Event Handlers inside Form parameters.
@@ -192,16 +211,17 @@ class Fulfillments:
         structure, not Fulfillment Route data structure as standard Events do.
         """
         if not fp.reprompt_handlers:
-            return stats
+            return
+
+        route = Fulfillment(page=fp.page, agent_type=self.agent_type)
+        route.verbose = self.verbose
+        route.agent_id = fp.page.agent_id
+        route.fulfillment_type = "reprompt_handler"
+        route.parameter = fp.display_name
 
         for handler in fp.reprompt_handlers:
-            route = Fulfillment(page=fp.page, agent_type=self.agent_type)
             route.data = handler
-            route.verbose = self.verbose
-            route.agent_id = fp.page.agent_id
-            route.fulfillment_type = "reprompt_handler"
-            route.parameter = fp.display_name
-            route.trigger = self.get_trigger_info(route)
+            route.trigger = self._reprompt_trigger(route)
             route = self.set_route_targets(route)
             path = route.data.get("triggerFulfillment", None)
             event = route.data.get("event", None)
@@ -212,66 +232,85 @@ class Fulfillments:
             # Flag for Webhook Handler
             self.check_for_webhook(fp.page, path)
 
-            stats = self.lint_fulfillment_type(stats, route, path, "messages")
+            self.lint_fulfillment_type(stats, route, path, "messages")
 
-        return stats
+    def lint_event_handler(self, route: Fulfillment, stats: LintStats):
+        """Lint a single Page Event Handler."""
+        path = route.data.get("triggerFulfillment", None)
+        event = route.data.get("event", None)
 
-    def lint_events(self, page: Page, stats: LintStats):
-        """Parse through all Page Event Handlers and lint."""
-        if not page.events:
-            return stats
+        if not path and not event:
+            return
 
-        for route_data in page.events:
-            route = Fulfillment(page=page, agent_type=self.agent_type)
-            route.data = route_data
-            route.agent_id = page.agent_id
-            route.fulfillment_type = "event"
-            route.trigger = self.get_trigger_info(route)
-            route = self.set_route_targets(route)
-            path = route.data.get("triggerFulfillment", None)
-            event = route.data.get("event", None)
+        # Flag for Webhook Handler
+        self.check_for_webhook_event_handlers(route)
 
-            if not path and not event:
-                continue
+        self.lint_fulfillment_type(stats, route, path, "messages")
 
-            # Flag for Webhook Handler
-            self.check_for_webhook_event_handlers(route)
+    def lint_transition_route(self, route: Fulfillment, stats: LintStats):
+        """Lint a single Transition Route."""
+        path = route.data.get("triggerFulfillment", None)
 
-            stats = self.lint_fulfillment_type(stats, route, path, "messages")
+        if not path:
+            return
 
-        return stats
+        # Flag for Webhook Handler
+        self.check_for_webhook(route.page, path)
 
-    def lint_routes(self, page: Page, stats: LintStats):
-        """Parse through all Transition Routes and lint."""
-        tf_key = "triggerFulfillment"
+        self.lint_fulfillment_type(stats, route, path, "messages")
 
-        if not page.routes:
-            return stats
+        # Preset Params can be linted here
+        self.lint_fulfillment_type(stats, route, path, "setParameterActions")
 
-        for route_data in page.routes:
-            route = Fulfillment(page=page)
+    def lint_routes_and_events(self, page: Page, stats: LintStats):
+        """Parse through all Transition Routes and Event Handlers and lint.
+
+        Both lists are walked in a single pass that reuses one Fulfillment.
+        Routes are linted before Events because the webhook error handler
+        check relies on the Routes having already flagged the Page webhook.
+        """
+        route = Fulfillment(page=page)
+        route.agent_id = page.agent_id
+
+        routes = (
+            (data, "transition_route", self._route_trigger)
+            for data in page.routes or []
+        )
+        events = (
+            (data, "event", self._event_trigger) for data in page.events or []
+        )
+
+        for route_data, fulfillment_type, trigger_builder in itertools.chain(
+            routes, events
+        ):
             route.data = route_data
-            route.agent_id = page.agent_id
-            route.fulfillment_type = "transition_route"
-            route.trigger = self.get_trigger_info(route)
+            route.fulfillment_type = fulfillment_type
+            route.trigger = trigger_builder(route)
             route = self.set_route_targets(route)
 
-            path = route.data.get(tf_key, None)
+            # Only Event Handlers carry the agent type for text rules.
+            if fulfillment_type == "event":
+                route.agent_type = self.agent_type
+                self.lint_event_handler(route, stats)
 
-            if not path:
-                continue
+            else:
+                self.lint_transition_route(route, stats)
 
-            # Flag for Webhook Handler
-            self.check_for_webhook(page, path)
+    def lint_routes(self, page: Page, stats: LintStats):
+        """Parse through all Transition Routes and lint."""
+        if not page.routes:
+            return
 
-            stats = self.lint_fulfillment_type(stats, route, path, "messages")
+        route = Fulfillment(page=page)
+        route.agent_id = page.agent_id
+        route.fulfillment_type = "transition_route"
 
-            # Preset Params can be linted here
-            stats = self.lint_fulfillment_type(
-                stats, route, path, "setParameterActions"
-            )
+        for route_data in page.routes:
+            route.data = route_data
+            route.trigger = self._route_trigger(route)
+            route = self.set_route_targets(route)
 
-        return stats
+            self.lint_transition_route(route, stats)
 
     def lint_entry(self, page: Page, stats: LintStats):
         """Lint Entry Fulfillment on a single page file.
@@ -282,7 +321,7 @@ class Fulfillments:
         """
 
         if not page.entry:
-            return stats
+            return
 
         route = Fulfillment(page=page)
         route.data = page.entry
@@ -293,6 +332,4 @@ class Fulfillments:
 
         self.check_for_webhook(page, path)
 
-        stats = self.lint_fulfillment_type(stats, route, path, "messages")
-
-        return stats
+        self.lint_fulfillment_type(stats, route, path, "messages")
@@ -14,21 +14,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import os
 
-from configparser import ConfigParser
 from typing import Dict, List, Any
 
 from cxlint.common import Common
 from cxlint.rules.test_cases import TestCaseRules
-from cxlint.resources.types import TestCase, LintStats
+from cxlint.resources.types import TestCase, LintStats, ConfigMap
 
 
 class TestCases:
     """Test Case linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.agent_id = Common.load_agent_id(config)
@@ -38,9 +36,10 @@ class TestCases:
         self.display_name_filter = self.load_display_name_filter(config)
 
         self.rules = TestCaseRules(console, self.disable_map)
+        self.intent_tps_cache = {}
 
     @staticmethod
-    def load_tag_filter(config: ConfigParser) -> Dict[str, str]:
+    def load_tag_filter(config: ConfigMap) -> Dict[str, str]:
         """Loads the config file for test cases into a map."""
         tag_list = (
             config["TEST CASE TAGS"]["include"].replace("\n", "").split(",")
@@ -59,7 +58,7 @@ class TestCases:
         return tag_list
 
     @staticmethod
-    def load_display_name_filter(config: ConfigParser) -> str:
+    def load_display_name_filter(config: ConfigMap) -> str:
         """Loads the matching pattern for test case display names."""
         pattern = config["TEST CASE DISPLAY NAME PATTERN"]["pattern"]
 
@@ -70,13 +69,11 @@ class TestCases:
         """Builds a list of files, each representing a test case."""
         root_dir = agent_local_path + "/testCases"
 
-        test_case_paths = []
-
-        for test_case in os.listdir(root_dir):
-            end = test_case.split(".")[-1]
-            if end == "json":
-                test_case_path = f"{root_dir}/{test_case}"
-                test_case_paths.append(test_case_path)
+        with os.scandir(root_dir) as entries:
+            test_case_paths = [
+                f"{root_dir}/{test_case.name}" for test_case in entries
+                if test_case.name.split(".")[-1] == "json"
+            ]
 
         return test_case_paths
 
@@ -130,13 +127,14 @@ class TestCases:
 
         intents_path = agent_local_path + "/intents"
 
-        intent_paths = []
-
-        for intent_dir in os.listdir(intents_path):
-            intent_dir_path = f"{intents_path}/{intent_dir}"
-            intent_paths.append(
-                {"intent": intent_dir, "file_path": intent_dir_path}
-            )
+        with os.scandir(intents_path) as entries:
+            intent_paths = [
+                {
+                    "intent": intent_dir.name,
+                    "file_path": f"{intents_path}/{intent_dir.name}",
+                }
+                for intent_dir in entries
+            ]
 
         return intent_paths
 
@@ -151,6 +149,35 @@ class TestCases:
 
         return cleaned_tps
 
+    def load_intent_tps(self, intent_dir: str) -> List[List[str]]:
+        """Load the cleaned TPs of each language file in an Intent dir.
+
+        Many Test Cases trigger the same Intents, so the directory probes and
+        parsed Training Phrases are cached per Intent dir for the current
+        lint run. Returns None if the Intent dir does not exist.
+        """
+        if intent_dir in self.intent_tps_cache:
+            return self.intent_tps_cache[intent_dir]
+
+        lang_tps = None
+        training_phrases_path = intent_dir + "/trainingPhrases"
+
+        if os.path.isdir(training_phrases_path):
+            lang_tps = []
+
+            with os.scandir(training_phrases_path) as entries:
+                for lang_file in entries:
+                    tp_data = Common.load_json(
+                        f"{training_phrases_path}/{lang_file.name}")
+                    lang_tps.append(self.flatten_tp_data(tp_data))
+
+        elif os.path.isdir(intent_dir):
+            lang_tps = []
+
+        self.intent_tps_cache[intent_dir] = lang_tps
+
+        return lang_tps
+
     def gather_intent_tps(self, tc: TestCase):
         # TODO Refactor
         """Collect all TPs associated with Intent data in Test Case."""
@@ -158,36 +185,20 @@ class TestCases:
 
         for i, pair in enumerate(tc.intent_data):
             intent_dir = tc.agent_path + "/intents/" + pair["intent"]
+            lang_tps = self.load_intent_tps(intent_dir)
 
-            try:
-                if "trainingPhrases" in os.listdir(intent_dir):
-                    training_phrases_path = intent_dir + "/trainingPhrases"
-
-                    for lang_file in os.listdir(training_phrases_path):
-                        # lang_code = lang_file.split(".")[0]
-                        lang_code_path = f"{training_phrases_path}/{lang_file}"
-
-                        with open(
-                            lang_code_path, "r", encoding="UTF-8"
-                        ) as tp_file:
-                            tp_data = json.load(tp_file)
-                            cleaned_tps = self.flatten_tp_data(tp_data)
-
-                            tp_file.close()
-
-                        # TODO pmarlow: refactor to use tc.intent_data instead
-                        # Need to create another level inside the Intent Dict
-                        # that contains the language files as well.
-                        tc.intent_data[i]["training_phrases"].extend(
-                            cleaned_tps
-                        )
-                        tc.associated_intent_data[pair["intent"]] = cleaned_tps
-
-            except FileNotFoundError:
+            if lang_tps is None:
                 tc.intent_data[i]["status"] = "invalid_intent"
                 tc.has_invalid_intent = True
                 continue
 
+            for cleaned_tps in lang_tps:
+                # TODO pmarlow: refactor to use tc.intent_data instead
+                # Need to create another level inside the Intent Dict
+                # that contains the language files as well.
+                tc.intent_data[i]["training_phrases"].extend(cleaned_tps)
+                tc.associated_intent_data[pair["intent"]] = cleaned_tps
+
         return tc
 
     def qualify_test_case(self, tc: TestCase):
@@ -218,23 +229,18 @@ class TestCases:
     def lint_test_case(self, tc: TestCase, stats: LintStats):
         """Lint a single Test Case file."""
 
-        with open(tc.dir_path, "r", encoding="UTF-8") as tc_file:
-            tc.data = json.load(tc_file)
-            tc.resource_id = tc.data.get("name", None)
-            tc.display_name = tc.data.get("displayName", None)
-            tc.tags = tc.data.get("tags", None)
-            tc.conversation_turns = tc.data.get(
-                "testCaseConversationTurns", None
-            )
-            tc.test_config = tc.data.get("testConfig", None)
-
-            tc = self.qualify_test_case(tc)
-
-            tc_file.close()
+        tc.data = Common.load_json(tc.dir_path)
+        tc.resource_id = tc.data.get("name", None)
+        tc.display_name = tc.data.get("displayName", None)
+        tc.tags = tc.data.get("tags", None)
+        tc.conversation_turns = tc.data.get(
+            "testCaseConversationTurns", None
+        )
+        tc.test_config = tc.data.get("testConfig", None)
 
-        stats = self.rules.run_test_case_rules(tc, stats)
+        tc = self.qualify_test_case(tc)
 
-        return stats
+        self.rules.run_test_case_rules(tc, stats)
 
     def lint_test_cases_directory(self, agent_local_path: str):
         """Linting the test cases dir in the JSON package structure."""
@@ -242,6 +248,7 @@ class TestCases:
         self.console.log(start_message)
 
         stats = LintStats()
+        self.intent_tps_cache = {}
 
         test_case_paths = self.build_test_case_path_list(agent_local_path)
 
@@ -254,7 +261,7 @@ class TestCases:
             tc.agent_path = agent_local_path
             tc.naming_pattern = self.naming_conventions.get(
                 "test_case_name", None)
-            stats = self.lint_test_case(tc, stats)
+            self.lint_test_case(tc, stats)
 
         header = "-" * 20
         rating = Common.calculate_rating(
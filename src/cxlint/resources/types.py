@@ -14,11 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 from typing import Dict, List, Any
 from dataclasses import dataclass, field
 
 from cxlint.graph import Graph
 
+# Parsed .cxlintrc contents, keyed by section and then by option.
+ConfigMap = Dict[str, Dict[str, str]]
+
+# dataclass(slots=True) is only available on Python 3.10+.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 @dataclass
 class AgentMetadata:
     """Used to track the current Agent Metadata attrinbutes."""
@@ -29,7 +38,7 @@ class AgentMetadata:
     speech_adaptation: bool = False
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Flow:
     """Used to track current Flow Attributes."""
 
@@ -47,12 +56,13 @@ class Flow:
     resource_id: str = None
     resource_type: str = "flow"
     start_page_file: str = None  # File Path Location of START_PAGE
+    sub_dirs: set = field(default_factory=set)  # e.g. pages
     unreachable_pages: set = field(default_factory=set)
     unused_pages: set = field(default_factory=set)
     verbose: bool = False
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Page:
     """Used to track current Page Attributes."""
 
@@ -107,7 +117,7 @@ class RouteGroup:
     verbose: bool = False
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Fulfillment:
     """Used to track current Fulfillment Attributes."""
 
@@ -201,7 +211,7 @@ class Webhook:
     timeout: int = 0
     verbose: bool = False
 
-@dataclass
+@dataclass(**SLOTS)
 class Resource:
     """Generic class to store basic Resource data.
 
@@ -226,7 +236,7 @@ class Resource:
     webhook_id: str = None
 
 
-@dataclass
+@dataclass(**SLOTS)
 class LintStats:
     """Used to track linter stats for each section processed."""
 
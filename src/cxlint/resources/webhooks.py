@@ -14,19 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import os
 
-from configparser import ConfigParser
 
 from cxlint.common import Common
 from cxlint.rules.webhooks import WebhookRules
-from cxlint.resources.types import Webhook, LintStats
+from cxlint.resources.types import Webhook, LintStats, ConfigMap
 
 class Webhooks:
     """Webhook linter methods and functions."""
 
-    def __init__(self, verbose: bool, config: ConfigParser, console):
+    def __init__(self, verbose: bool, config: ConfigMap, console):
         self.verbose = verbose
         self.console = console
         self.config = config
@@ -41,11 +39,12 @@ class Webhooks:
         """Builds a list of webhook file locations."""
         root_dir = agent_local_path + "/webhooks"
 
-        webhook_paths = []
-
-        for webhook_file in os.listdir(root_dir):
-            webhook_file_path = f"{root_dir}/{webhook_file}"
-            webhook_paths.append(webhook_file_path)
+        with os.scandir(root_dir) as entries:
+            webhook_paths = [
+                f"{root_dir}/{webhook_file.name}"
+                for webhook_file in entries
+                if webhook_file.is_file()
+            ]
 
         return webhook_paths
 
@@ -60,24 +59,19 @@ class Webhooks:
 
         return webhook.service_type
 
-    def lint_webhook(self, webhook: Webhook, stats: LintStats) -> LintStats:
+    def lint_webhook(self, webhook: Webhook, stats: LintStats) -> None:
         """Lint a single Webhook file."""
 
-        with open(webhook.dir_path, "r", encoding="UTF-8") as webhook_file:
-            webhook.data = json.load(webhook_file)
-            webhook.resource_id = webhook.data.get("name", None)
-            webhook.display_name = webhook.data.get("displayName", None)
-            webhook.service_type = self.get_service_type(webhook)
-
-            timeout_dict = webhook.data.get("timeout", None)
-            if timeout_dict:
-                webhook.timeout = timeout_dict.get("seconds", None)
-
-            webhook_file.close()
+        webhook.data = Common.load_json(webhook.dir_path)
+        webhook.resource_id = webhook.data.get("name", None)
+        webhook.display_name = webhook.data.get("displayName", None)
+        webhook.service_type = self.get_service_type(webhook)
 
-        stats = self.rules.run_webhook_rules(webhook, stats)
+        timeout_dict = webhook.data.get("timeout", None)
+        if timeout_dict:
+            webhook.timeout = timeout_dict.get("seconds", None)
 
-        return stats
+        self.rules.run_webhook_rules(webhook, stats)
 
     def lint_webhooks_directory(self, agent_local_path: str):
         """Linting the top level Webhooks Dir in the JSON Package structure.
@@ -103,7 +97,7 @@ class Webhooks:
                 "webhook_name", None)
 
             stats.total_webhooks += 1
-            stats = self.lint_webhook(webhook, stats)
+            self.lint_webhook(webhook, stats)
 
         header = "-" * 20
         rating = Common.calculate_rating(
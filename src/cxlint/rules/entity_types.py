@@ -21,6 +21,10 @@ from cxlint.resources.types import EntityType, LintStats, Resource
 
 from cxlint.rules.logger import RulesLogger
 
+EXTRA_WHITESPACE_PATTERN = re.compile(r"\s{2,}")
+YES_NO_PATTERN = re.compile(r"^(?:yes|no)$", re.IGNORECASE)
+
+
 class EntityTypeRules:
     """Entity Type Rules and Definitions."""
     def __init__(
@@ -32,15 +36,18 @@ class EntityTypeRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        self.naming_enabled = disable_map.get("naming-conventions", True)
+        self.yes_no_enabled = disable_map.get("yes-no-entities", True)
+        self.whitespace_enabled = disable_map.get(
+            "extra-display-name-whitespace", True)
+
     @staticmethod
     def entity_regex_matching(data: Union[List[str], str]) -> bool:
         """Checks Entities and synonyms for issues based on regex pattern."""
         issue_found = False
-        pattern = r"^(?:yes|no)$"
-
         # Checks the individual Entity key
         if isinstance(data, str):
-            data_match = re.search(pattern, data, flags=re.IGNORECASE)
+            data_match = YES_NO_PATTERN.search(data)
             if data_match:
                 issue_found = True
 
@@ -49,7 +56,7 @@ class EntityTypeRules:
             n = len(data)
             i = 0
             while i != n:
-                data_match = re.search(pattern, data[i], flags=re.IGNORECASE)
+                data_match = YES_NO_PATTERN.search(data[i])
                 if data_match:
                     issue_found = True
                     break
@@ -63,7 +70,7 @@ class EntityTypeRules:
             etype: EntityType,
             entity: str,
             lang_code: str,
-            stats: LintStats) -> LintStats:
+            stats: LintStats) -> None:
         """Check the Entity inside the Entity Type for yes/no phrases."""
         stats.total_inspected += 1
 
@@ -82,14 +89,12 @@ class EntityTypeRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     def _yes_no_synonym_check(
         self,
         etype: EntityType,
         synonyms: List[str],
         lang_code: str,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check the Synonyms of the Entity for yes/no phrases."""
         stats.total_inspected += 1
 
@@ -108,13 +113,11 @@ class EntityTypeRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # naming-conventions
     def entity_type_naming_convention(
         self,
         etype: EntityType,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check that the Entity Type display name conform to given pattern."""
         rule = "R015: Naming Conventions"
 
@@ -136,13 +139,11 @@ class EntityTypeRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # extra-display-name-whitespace
     def entity_display_name_extra_whitespaces(
         self,
         etype: EntityType,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check Entity display name for extra whitespace characters."""
         rule = "R016: Extra Whitespace in Display Name"
 
@@ -150,7 +151,7 @@ class EntityTypeRules:
 
         res = bool(etype.display_name.startswith(" ") or
                    etype.display_name.endswith(" ") or
-                   re.search(r"\s{2,}", etype.display_name))
+                   EXTRA_WHITESPACE_PATTERN.search(etype.display_name))
 
         if res :
             resource = Resource()
@@ -164,42 +165,36 @@ class EntityTypeRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # yes-no-entities
     def yes_no_entities(
         self,
         etype: EntityType,
         lang_code: str,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check that yes/no Entities or Synonyms aren't used in the agent."""
         for entity in etype.entities[lang_code]["entities"]:
             value = entity["value"]
             synonyms = entity["synonyms"]
 
-            stats = self._yes_no_entity_check(etype, value, lang_code, stats)
-            stats = self._yes_no_synonym_check(
+            self._yes_no_entity_check(etype, value, lang_code, stats)
+            self._yes_no_synonym_check(
                 etype, synonyms, lang_code, stats
             )
 
-        return stats
-
     def run_entity_type_rules(
         self,
         etype: EntityType,
         lang_code: str,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Checks and Executes all Entity Type level rules."""
         # naming-conventions
-        if self.disable_map.get("naming-conventions", True):
-            stats = self.entity_type_naming_convention(etype, stats)
+        if self.naming_enabled:
+            self.entity_type_naming_convention(etype, stats)
 
         # yes-no-entities
-        if self.disable_map.get("yes-no-entities", True):
-            stats = self.yes_no_entities(etype, lang_code, stats)
+        if self.yes_no_enabled:
+            self.yes_no_entities(etype, lang_code, stats)
 
         # extra-display-name-whitespace
-        if self.disable_map.get("extra-display-name-whitespace", True):
-            stats = self.entity_display_name_extra_whitespaces(etype, stats)
-
-        return stats
+        if self.whitespace_enabled:
+            self.entity_display_name_extra_whitespaces(etype, stats)
@@ -21,6 +21,9 @@ from cxlint.resources.types import Flow, LintStats, Resource
 
 from cxlint.rules.logger import RulesLogger
 
+EXTRA_WHITESPACE_PATTERN = re.compile(r"\s{2,}")
+
+
 class FlowRules:
     """Flow Rules and Definitions."""
     def __init__(
@@ -32,11 +35,19 @@ class FlowRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        self.naming_enabled = disable_map.get("naming-conventions", True)
+        self.unused_pages_enabled = disable_map.get("unused-pages", True)
+        self.dangling_pages_enabled = disable_map.get("dangling-pages", True)
+        self.unreachable_pages_enabled = disable_map.get(
+            "unreachable-pages", True)
+        self.whitespace_enabled = disable_map.get(
+            "extra-display-name-whitespace", True)
+
     # naming-conventions
     def flow_naming_convention(
             self,
             flow: Flow,
-            stats: LintStats) -> LintStats:
+            stats: LintStats) -> None:
         """Check that the Flow Display Name conforms to naming conventions."""
         rule = "R015: Naming Conventions"
 
@@ -60,10 +71,8 @@ class FlowRules:
 
                 self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # unused-pages
-    def unused_pages(self, flow: Flow, stats: LintStats) -> LintStats:
+    def unused_pages(self, flow: Flow, stats: LintStats) -> None:
         """Checks for Unusued Pages in Flow Graph."""
         rule = "R012: Unused Pages"
 
@@ -82,10 +91,8 @@ class FlowRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # dangling-pages
-    def dangling_pages(self, flow: Flow, stats: LintStats) -> LintStats:
+    def dangling_pages(self, flow: Flow, stats: LintStats) -> None:
         """Checks for Dangling Pages in Flow Graph."""
         rule = "R013: Dangling Pages"
 
@@ -104,10 +111,8 @@ class FlowRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # unreachable-pages
-    def unreachable_pages(self, flow: Flow, stats: LintStats) -> LintStats:
+    def unreachable_pages(self, flow: Flow, stats: LintStats) -> None:
         """Checks for Unreachable Pages in Flow Graph."""
         rule = "R014: Unreachable Pages"
 
@@ -126,19 +131,17 @@ class FlowRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # extra-display-name-whitespace
     def flow_display_name_extra_whitespaces(
         self,
         flow: Flow,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check Flow display name for extra whitespace characters."""
         rule = "R016: Extra Whitespace in Display Name"
 
         res = bool(flow.display_name.startswith(" ") or
                    flow.display_name.endswith(" ") or
-                   re.search(r"\s{2,}", flow.display_name))
+                   EXTRA_WHITESPACE_PATTERN.search(flow.display_name))
 
         if res :
             resource = Resource()
@@ -155,30 +158,26 @@ class FlowRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
 
-
-    def run_flow_rules(self, flow: Flow, stats: LintStats) -> LintStats:
+    def run_flow_rules(self, flow: Flow, stats: LintStats) -> None:
         """Checks and Executes all Flow level rules."""
         # naming-conventions
-        if self.disable_map.get("naming-conventions", True):
-            stats = self.flow_naming_convention(flow, stats)
+        if self.naming_enabled:
+            self.flow_naming_convention(flow, stats)
 
         # unused-pages
-        if self.disable_map.get("unused-pages", True):
-            stats = self.unused_pages(flow, stats)
+        if self.unused_pages_enabled:
+            self.unused_pages(flow, stats)
 
         # dangling-pages
-        if self.disable_map.get("dangling-pages", True):
-            stats = self.dangling_pages(flow, stats)
+        if self.dangling_pages_enabled:
+            self.dangling_pages(flow, stats)
 
         # unreachable-pages
-        if self.disable_map.get("unreachable-pages", True):
-            stats = self.unreachable_pages(flow, stats)
+        if self.unreachable_pages_enabled:
+            self.unreachable_pages(flow, stats)
 
         # extra-display-name-whitespace
-        if self.disable_map.get("extra-display-name-whitespace", True):
-            stats = self.flow_display_name_extra_whitespaces(flow, stats)
-
+        if self.whitespace_enabled:
+            self.flow_display_name_extra_whitespaces(flow, stats)
 
-        return stats
@@ -14,13 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
 
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Pattern, Union
 from cxlint.resources.types import Intent, LintStats, Resource
 
 from cxlint.rules.logger import RulesLogger
 
+EXTRA_WHITESPACE_PATTERN = re.compile(r"\s{2,}")
+CONFIRMATION_PHRASES = frozenset(("yes", "no"))
+ESCALATION_PHRASES = frozenset(("escalate", "operator"))
+
+
+@functools.lru_cache(maxsize=None)
+def compile_naming_pattern(pattern: str) -> Pattern:
+    """Compile each configured naming convention pattern once."""
+    return re.compile(pattern)
+
+
 class IntentRules:
     """Intent Rules and Definitions."""
     def __init__(
@@ -32,6 +44,22 @@ class IntentRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        self.naming_enabled = disable_map.get("naming-conventions", True)
+        self.min_tps_enabled = disable_map.get("intent-min-tps", True)
+        self.missing_tps_enabled = disable_map.get("intent-missing-tps", True)
+        self.whitespace_enabled = disable_map.get(
+            "extra-display-name-whitespace", True)
+
+    @staticmethod
+    def build_intent_resource(intent: Intent) -> Resource:
+        """Build the logger Resource for an Intent that has an issue."""
+        return Resource(
+            agent_id=intent.agent_id,
+            intent_display_name=intent.display_name,
+            intent_id=intent.resource_id,
+            resource_type="intent",
+        )
+
     @staticmethod
     def check_if_head_intent(intent: Intent) -> bool:
         """Checks if Intent is Head Intent based on labels and name."""
@@ -45,26 +73,12 @@ class IntentRules:
     @staticmethod
     def check_if_confirmation_intent(tps: List[str]) -> bool:
         """Check if the Intent contains yes/no phrases for confirmation."""
-        confirm = False
-        confirm_set = set(["yes", "no"])
-
-        res = confirm_set.intersection(set(tps))
-        if res:
-            confirm = True
-
-        return confirm
+        return not CONFIRMATION_PHRASES.isdisjoint(tps)
 
     @staticmethod
     def check_if_escalation_intent(tps: List[str]) -> bool:
         """Check if the Intent contains escalation phrases."""
-        escalate = False
-        escalate_set = set(["escalate", "operator"])
-
-        res = escalate_set.intersection(set(tps))
-        if res:
-            escalate = True
-
-        return escalate
+        return not ESCALATION_PHRASES.isdisjoint(tps)
 
     @staticmethod
     def flatten_training_phrase_parts(parts: Dict[str, Any]) -> List[str]:
@@ -73,28 +87,20 @@ class IntentRules:
         # If the TP Part has more than 1 part, we need to extract and
         # concat the data into a single string
         if len(parts) > 1:
-            utterance = ""
-            for part in parts:
-                utterance += part.get("text", "")
+            return "".join(part.get("text", "") for part in parts)
 
         # Otherwise, there's just 1 part so we can take it as-is
-        else:
-            utterance = parts[0].get("text", None)
-
-        return utterance
+        return parts[0].get("text", None)
 
     def gather_training_phrases(
         self, intent: Intent, lang_code: str) -> List[str]:
         """Flatten the Training Phrase proto to a list of strings."""
-        tps_flat = []
         tps_original = intent.training_phrases.get(lang_code, None)["tps"]
 
-        for tp in tps_original:
-            parts = tp.get("parts", None)
-            utterance = self.flatten_training_phrase_parts(parts)
-            tps_flat.append(utterance)
-
-        return tps_flat
+        return [
+            self.flatten_training_phrase_parts(tp.get("parts", None))
+            for tp in tps_original
+        ]
 
     def check_and_log_naming(
         self,
@@ -106,11 +112,7 @@ class IntentRules:
         rule = "R015: Naming Conventions"
 
         if not res:
-            resource = Resource()
-            resource.agent_id = intent.agent_id
-            resource.intent_display_name = intent.display_name
-            resource.intent_id = intent.resource_id
-            resource.resource_type = "intent"
+            resource = self.build_intent_resource(intent)
 
             message = ": Intent Display Name does not meet the specified"\
                 f" Convention : {pattern}"
@@ -119,61 +121,48 @@ class IntentRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # naming-conventions
     def intent_naming_convention(
         self,
         intent: Intent,
         lang_code: str,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check that the Display Name conforms to naming conventions."""
 
-        hid = self.check_if_head_intent(intent)
-        tps = self.gather_training_phrases(intent, lang_code)
-        confirm = self.check_if_confirmation_intent(tps)
-        escalate = self.check_if_escalation_intent(tps)
-
         # Head Intents
-        if hid and intent.naming_pattern_head:
+        if self.check_if_head_intent(intent) and intent.naming_pattern_head:
             pattern = intent.naming_pattern_head
-            res = re.search(pattern, intent.display_name)
-            stats.total_inspected += 1
-
-            stats = self.check_and_log_naming(intent, stats, res, pattern)
 
-        # Confirmation Intents
-        elif confirm and intent.naming_pattern_confirmation:
-            pattern = intent.naming_pattern_confirmation
-            res = re.search(pattern, intent.display_name)
-            stats.total_inspected += 1
+        else:
+            # Only flatten the training phrases when they decide the pattern
+            tps = self.gather_training_phrases(intent, lang_code)
 
-            stats = self.check_and_log_naming(intent, stats, res, pattern)
+            # Confirmation Intents
+            if (intent.naming_pattern_confirmation
+                    and self.check_if_confirmation_intent(tps)):
+                pattern = intent.naming_pattern_confirmation
 
-        # Escalation Intents
-        elif escalate and intent.naming_pattern_escalation:
-            pattern = intent.naming_pattern_escalation
-            res = re.search(pattern, intent.display_name)
-            stats.total_inspected += 1
+            # Escalation Intents
+            elif (intent.naming_pattern_escalation
+                    and self.check_if_escalation_intent(tps)):
+                pattern = intent.naming_pattern_escalation
 
-            stats = self.check_and_log_naming(intent, stats, res, pattern)
+            # Generic Intents
+            else:
+                pattern = intent.naming_pattern_generic
 
-        # Generic Intents
-        elif intent.naming_pattern_generic:
-            pattern = intent.naming_pattern_generic
-            res = re.search(pattern, intent.display_name)
+        if pattern:
+            res = compile_naming_pattern(pattern).search(intent.display_name)
             stats.total_inspected += 1
 
-            stats = self.check_and_log_naming(intent, stats, res, pattern)
-
-        return stats
+            self.check_and_log_naming(intent, stats, res, pattern)
 
 
     # intent-missing-metadata
     def intent_missing_metadata(
         self,
         intent: Intent,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Flags Intent that has missing metadata file.
 
         This rule is separate from the main group of Intent rules because it
@@ -184,24 +173,18 @@ class IntentRules:
         rule = "R010: Missing Metadata file for Intent"
         message = ""
 
-        resource = Resource()
-        resource.agent_id = intent.agent_id
-        resource.intent_display_name = intent.display_name
-        resource.intent_id = intent.resource_id
-        resource.resource_type = "intent"
+        resource = self.build_intent_resource(intent)
 
         stats.total_inspected += 1
         stats.total_issues += 1
 
         self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # intent-missing-tps
     def missing_training_phrases(
         self,
         intent: Intent,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Checks for Intents that are Missing Training Phrases
 
         This rule is separate from the main group of Intent rules because it
@@ -209,61 +192,49 @@ class IntentRules:
         If data is completely missing (i.e. no training phrases), the file
         is never opened and we only flag the missing phrases.
         """
-        if self.disable_map.get("intent-missing-tps", True):
+        if self.missing_tps_enabled:
             rule = "R004: Intent is Missing Training Phrases."
             message = f": {intent.training_phrases}"
 
-            resource = Resource()
-            resource.agent_id = intent.agent_id
-            resource.intent_display_name = intent.display_name
-            resource.intent_id = intent.resource_id
-            resource.resource_type = "intent"
+            resource = self.build_intent_resource(intent)
 
             stats.total_inspected += 1
             stats.total_issues += 1
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # intent-min-tps
     def min_tps_head_intent(
         self,
         intent: Intent,
         lang_code: str,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Determines if Intent has min recommended training phrases"""
         n_tps = len(intent.training_phrases[lang_code]["tps"])
         stats.total_inspected += 1
 
         hid = self.check_if_head_intent(intent)
 
-        resource = Resource()
-        resource.agent_id = intent.agent_id
-        resource.intent_display_name = intent.display_name
-        resource.intent_id = intent.resource_id
-        resource.resource_type = "intent"
-
         if hid and n_tps < 50:
             rule = "R005: Head Intent Does Not Have Minimum Training Phrases."
             message = f": {lang_code} : ({n_tps} / 50)"
 
-            stats.total_issues += 1
-            self.log.generic_logger(resource, rule, message)
-
         elif n_tps < 20:
             rule = "R005: Intent Does Not Have Minimum Training Phrases."
             message = f": {lang_code} : ({n_tps} / 20)"
 
-            stats.total_issues += 1
-            self.log.generic_logger(resource, rule, message)
+        else:
+            return
 
-        return stats
+        resource = self.build_intent_resource(intent)
+
+        stats.total_issues += 1
+        self.log.generic_logger(resource, rule, message)
 
     # extra-display-name-whitespace
     def intent_display_name_extra_whitespaces(
         self,
         intent: Intent,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check Intent display name for extra whitespace characters."""
         rule = "R016: Extra Whitespace in Display Name"
 
@@ -271,28 +242,22 @@ class IntentRules:
 
         res = bool(intent.display_name.startswith(" ") or
                    intent.display_name.endswith(" ") or
-                   re.search(r"\s{2,}", intent.display_name))
+                   EXTRA_WHITESPACE_PATTERN.search(intent.display_name))
 
         if res :
-            resource = Resource()
-            resource.agent_id = intent.agent_id
-            resource.intent_display_name = intent.display_name
-            resource.intent_id = intent.resource_id
-            resource.resource_type = "intent"
+            resource = self.build_intent_resource(intent)
 
             message = ""
             stats.total_issues += 1
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
 
     def run_training_phrase_rules(
         self,
         intent: Intent,
         lang_code: str,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Checks and Executes all Intent/Training Phrase level rules.
 
         The requirements for a rule in this section are:
@@ -300,15 +265,13 @@ class IntentRules:
           - Intent must have at least 1 training phrase
         """
         # naming-conventions
-        if self.disable_map.get("naming-conventions", True):
-            stats = self.intent_naming_convention(intent, lang_code, stats)
+        if self.naming_enabled:
+            self.intent_naming_convention(intent, lang_code, stats)
 
         # intent-min-tps
-        if self.disable_map.get("intent-min-tps", True):
-            stats = self.min_tps_head_intent(intent, lang_code, stats)
+        if self.min_tps_enabled:
+            self.min_tps_head_intent(intent, lang_code, stats)
 
         # extra-display-name-whitespace
-        if self.disable_map.get("extra-display-name-whitespace", True):
-            stats = self.intent_display_name_extra_whitespaces(intent, stats)
-
-        return stats
+        if self.whitespace_enabled:
+            self.intent_display_name_extra_whitespaces(intent, stats)
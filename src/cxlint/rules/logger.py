@@ -16,6 +16,32 @@
 
 from cxlint.resources.types import Resource
 
+LINK_BASE = "https://dialogflow.cloud.google.com/cx/"
+
+# Console link path and label for each resource type. Only the entries for
+# the logged resource type are formatted, once per issue.
+LINK_PATHS = {
+    "entity_type": lambda r: f"/entityTypes?id={r.entity_type_id}",
+    "flow": lambda r: f"/flows/{r.flow_id}",
+    "fulfillment": lambda r: f"/flows/{r.flow_id}"
+    f"/flow_creation?pageId={r.page_id}",
+    "intent": lambda r: f"/intents?id={r.intent_id}",
+    "page": lambda r: f"/flows/{r.flow_id}"
+    f"/flow_creation?pageId={r.page_id}",
+    "test_case": lambda r: f"/testCases/{r.test_case_id}",
+    "webhook": lambda r: f"/webhooks/{r.webhook_id}",
+}
+LINK_LABELS = {
+    "entity_type": lambda r: r.entity_type_display_name,
+    "flow": lambda r: r.flow_display_name,
+    "fulfillment": lambda r: f"{r.flow_display_name} : "
+    f"{r.page_display_name}",
+    "intent": lambda r: r.intent_display_name,
+    "page": lambda r: f"{r.flow_display_name} : {r.page_display_name}",
+    "test_case": lambda r: r.test_case_display_name,
+    "webhook": lambda r: r.webhook_display_name,
+}
+
 class RulesLogger:
     """Common Logger for Rules output."""
     def __init__(
@@ -28,23 +54,9 @@ class RulesLogger:
     def create_link(resource):
         link = None
 
-        if resource.agent_id and resource.agent_id != "":
-            base = "https://dialogflow.cloud.google.com/cx/"
-
-            link_map = {
-                "entity_type": f"/entityTypes?id={resource.entity_type_id}",
-                "flow": f"/flows/{resource.flow_id}",
-                "fulfillment": f"/flows/{resource.flow_id}"
-                f"/flow_creation?pageId={resource.page_id}",
-                "intent": f"/intents?id={resource.intent_id}",
-                "page": f"/flows/{resource.flow_id}"
-                f"/flow_creation?pageId={resource.page_id}",
-                "test_case": f"/testCases/{resource.test_case_id}",
-                "webhook": f"/webhooks/{resource.webhook_id}"
-            }
-
-            path = link_map.get(resource.resource_type, None)
-            link = base + resource.agent_id + path
+        if resource.agent_id:
+            path = LINK_PATHS[resource.resource_type](resource)
+            link = LINK_BASE + resource.agent_id + path
 
         return link
 
@@ -53,22 +65,12 @@ class RulesLogger:
     ) -> None:
         """Generic Logger for various resources."""
         url = self.create_link(resource)
+        label = LINK_LABELS.get(resource.resource_type, None)
 
-        link_map = {
-            "entity_type": f"[link={url}]"\
-                f"{resource.entity_type_display_name}[/link]",
-            "flow": f"[link={url}]{resource.flow_display_name}[/link]",
-            "fulfillment": f"[link={url}]{resource.flow_display_name} : "\
-                f"{resource.page_display_name}[/link]",
-            "intent": f"[link={url}]{resource.intent_display_name}[/link]",
-            "page": f"[link={url}]{resource.flow_display_name} : "\
-                f"{resource.page_display_name}[/link]",
-            "test_case": f"[link={url}]"\
-                f"{resource.test_case_display_name}[/link]",
-            "webhook": f"[link={url}]{resource.webhook_display_name}[/link]",
-        }
+        final_link = None
+        if label:
+            final_link = f"[link={url}]{label(resource)}[/link]"
 
-        final_link = link_map.get(resource.resource_type, None)
         output = f"{rule} : {final_link} {message}"
 
         self.console.log(output)
@@ -21,6 +21,9 @@ from cxlint.resources.types import Page, LintStats, Resource
 
 from cxlint.rules.logger import RulesLogger
 
+EXTRA_WHITESPACE_PATTERN = re.compile(r"\s{2,}")
+
+
 class PageRules:
     """Page Level Rules and Definitions."""
     def __init__(
@@ -32,6 +35,16 @@ class PageRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        self.naming_enabled = disable_map.get("naming-conventions", True)
+        self.webhook_handlers_enabled = disable_map.get(
+            "missing-webhook-event-handlers", True)
+        self.whitespace_enabled = disable_map.get(
+            "extra-display-name-whitespace", True)
+        self.no_match_handler_enabled = disable_map.get(
+            "page-form-no-match-handler", True)
+        self.no_input_handler_enabled = disable_map.get(
+            "page-form-no-input-handler", True)
+
     @staticmethod
     def _gather_params_and_handlers(parameter):
         """Check to see if Reprompt Event Handlers exist."""
@@ -71,16 +84,14 @@ class PageRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # naming-conventions
     def page_naming_conventions(
-        self, page: Page, stats: LintStats) -> LintStats:
+        self, page: Page, stats: LintStats) -> None:
         """Check that the Page Display Name conform to naming conventions."""
 
         # Return early if Start Page
         if page.display_name == "Start Page":
-            return stats
+            return
 
         # Form Pages
         if page.form and page.naming_pattern_form:
@@ -88,7 +99,7 @@ class PageRules:
             res = re.search(pattern, page.display_name)
             stats.total_inspected += 1
 
-            stats = self.check_and_log_naming(page, stats, res, pattern)
+            self.check_and_log_naming(page, stats, res, pattern)
 
         # Webhook Pages
         elif page.has_webhook and page.naming_pattern_webhook:
@@ -96,7 +107,7 @@ class PageRules:
             res = re.search(pattern, page.display_name)
             stats.total_inspected += 1
 
-            stats = self.check_and_log_naming(page, stats, res, pattern)
+            self.check_and_log_naming(page, stats, res, pattern)
 
         # Generic Pages
         elif page.naming_pattern_generic:
@@ -104,13 +115,11 @@ class PageRules:
             res = re.search(pattern, page.display_name)
             stats.total_inspected += 1
 
-            stats = self.check_and_log_naming(page, stats, res, pattern)
-
-        return stats
+            self.check_and_log_naming(page, stats, res, pattern)
 
     # missing-webhook-event-handlers
     def missing_webhook_event_handlers(
-        self, page: Page, stats: LintStats) -> LintStats:
+        self, page: Page, stats: LintStats) -> None:
         """Checks for missing Event Handlers on pages that use Webhooks."""
         rule = "R011: Missing Webhook Event Handlers"
 
@@ -130,13 +139,11 @@ class PageRules:
             stats.total_issues += 1
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # extra-display-name-whitespace
     def page_display_name_extra_whitespaces(
         self,
         page: Page,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Check Page display name for extra whitespace characters."""
         rule = "R016: Extra Whitespace in Display Name"
 
@@ -144,7 +151,7 @@ class PageRules:
 
         res = bool(page.display_name.startswith(" ") or
                    page.display_name.endswith(" ") or
-                   re.search(r"\s{2,}", page.display_name))
+                   EXTRA_WHITESPACE_PATTERN.search(page.display_name))
 
         if res :
             resource = Resource()
@@ -160,11 +167,9 @@ class PageRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # page-form-no-match-handler
     def page_form_no_match_handler(
-        self, page: Page, stats: LintStats) -> LintStats:
+        self, page: Page, stats: LintStats) -> None:
         """Check Page Form Parameters for NO_MATCH handlers."""
         rule = "R017: Missing NO_MATCH Handlers on Form"
 
@@ -191,11 +196,9 @@ class PageRules:
 
                 self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # page-form-no-input-handler
     def page_form_no_input_handler(
-        self, page: Page, stats: LintStats) -> LintStats:
+        self, page: Page, stats: LintStats) -> None:
         """Check Page Form Parameters for NO_INPUT handlers."""
         rule = "R018: Missing NO_INPUT Handlers on Form"
 
@@ -222,28 +225,24 @@ class PageRules:
 
                 self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     def run_page_rules(self, page: Page, stats: LintStats):
         """Checks and Executes all Page level rules."""
         # naming-conventions
-        if self.disable_map.get("naming-conventions", True):
-            stats = self.page_naming_conventions(page, stats)
+        if self.naming_enabled:
+            self.page_naming_conventions(page, stats)
 
         # missing-webhook-event-handlers
-        if self.disable_map.get("missing-webhook-event-handlers", True):
-            stats = self.missing_webhook_event_handlers(page, stats)
+        if self.webhook_handlers_enabled:
+            self.missing_webhook_event_handlers(page, stats)
 
         # extra-display-name-whitespace
-        if self.disable_map.get("extra-display-name-whitespace", True):
-            stats = self.page_display_name_extra_whitespaces(page, stats)
+        if self.whitespace_enabled:
+            self.page_display_name_extra_whitespaces(page, stats)
 
         # page-form-no-match-handler
-        if self.disable_map.get("page-form-no-match-handler", True):
+        if self.no_match_handler_enabled:
             self.page_form_no_match_handler(page,stats)
 
         # page-form-no-input-handler
-        if self.disable_map.get("page-form-no-input-handler", True):
+        if self.no_input_handler_enabled:
             self.page_form_no_input_handler(page,stats)
-
-        return stats
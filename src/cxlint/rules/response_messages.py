@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
 
 from typing import Dict, Any
@@ -21,6 +22,49 @@ from cxlint.resources.types import Fulfillment, LintStats, Resource
 
 from cxlint.rules.logger import RulesLogger
 
+# Response Message text patterns are compiled once and shared by all texts.
+# The lookahead form of the closed-choice pattern matches the same texts as
+# `^(What|...|Would) (.*) or (.*)\?$` without its quadratic backtracking on
+# long texts that contain many ` or ` and do not end in `?`.
+CLOSED_CHOICE_PATTERN = re.compile(
+    r"^(?:What|Where|When|Who|Why|How|Would) (?=[^\n]* or )[^\n]*\?$",
+    re.IGNORECASE,
+)
+WH_QUESTION_PATTERN = re.compile(
+    r"^(what|when|where|who|why|how)\b.*\?$", re.IGNORECASE
+)
+CLARIFYING_QUESTION_PATTERN = re.compile(
+    r"^(what|when|where|who|why|how)\b.*\.$", re.IGNORECASE
+)
+
+# Every text pattern above starts with a Wh- word (or "Would") and ends with
+# punctuation, so texts that start with any other word or are shorter than
+# e.g. "Who?" can skip the regexes altogether.
+WH_PREFIXES = ("what", "when", "where", "who", "why", "how", "would")
+MIN_TEXT_LENGTH = 4
+
+# Agents reuse many texts across Pages, so pattern verdicts are memoized.
+TEXT_CACHE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def is_closed_choice(text: str) -> bool:
+    """Check text against the R001 closed-choice pattern."""
+    return "?" in text[-2:] and bool(CLOSED_CHOICE_PATTERN.search(text))
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def is_wh_question(text: str) -> bool:
+    """Check text against the R002 Wh- question pattern."""
+    return "?" in text[-2:] and bool(WH_QUESTION_PATTERN.search(text))
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def is_clarifying_question(text: str) -> bool:
+    """Check text against the R003 clarifying question pattern."""
+    return "." in text[-2:] and bool(CLARIFYING_QUESTION_PATTERN.search(text))
+
+
 class ResponseMessageRules:
     """Response Message Rules and Definitions."""
     def __init__(
@@ -32,11 +76,23 @@ class ResponseMessageRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        # The disable map is fixed for the life of the linter, so resolve the
+        # enabled text rules once instead of for every Response Message.
+        text_rules = {
+            "closed-choice-alternative": self.closed_choice_alternative_parser,
+            "wh-questions": self.wh_questions,
+            "clarifying-questions": self.clarifying_questions,
+        }
+        self.text_rules = [
+            rule for name, rule in text_rules.items()
+            if self.disable_map.get(name, True)
+        ]
+
    # RESPONSE MESSAGE RULES
     # closed-choice-alternative
     def closed_choice_alternative_parser(
         self, route: Fulfillment, stats: LintStats
-    ) -> LintStats:
+    ) -> None:
         """Identifies a Closed Choice Alternative Question."""
         rule = (
             "R001: Closed-Choice Alternative Missing Intermediate `?` "
@@ -44,9 +100,7 @@ class ResponseMessageRules:
         )
         message = f": {route.trigger}"
 
-        pattern = r"^(What|Where|When|Who|Why|How|Would) (.*) or (.*)\?$"
-
-        match = re.search(pattern, route.text, flags=re.IGNORECASE)
+        match = is_closed_choice(route.text)
 
         if match:
             resource = Resource()
@@ -60,19 +114,15 @@ class ResponseMessageRules:
             stats.total_issues += 1
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # wh-questions
-    def wh_questions(self, route: Fulfillment, stats: LintStats) -> LintStats:
+    def wh_questions(self, route: Fulfillment, stats: LintStats) -> None:
         """Identifies a Wh- Question and checks for appropriate punctuation."""
         rule = "R002: Wh- Question Should Use `.` Instead of `?` Punctuation"
         message = f": {route.trigger}"
 
-        pattern = r"^(what|when|where|who|why|how)\b.*\?$"
+        match = "event" not in route.trigger and is_wh_question(route.text)
 
-        match = re.search(pattern, route.text, flags=re.IGNORECASE)
-
-        if match and "event" not in route.trigger:
+        if match:
             resource = Resource()
             resource.agent_id = route.agent_id
             resource.flow_display_name = route.page.flow.display_name
@@ -84,22 +134,17 @@ class ResponseMessageRules:
             stats.total_issues += 1
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # clarifying-questions
     def clarifying_questions(
         self, route: Fulfillment, stats: LintStats
-    ) -> LintStats:
+    ) -> None:
         """Identifies Clarifying Questions that are missing `?` Punctuation."""
         rule = "R003: Clarifying Question Should Use `?` Punctuation"
         message = f": {route.trigger}"
 
-        # updated pattern
-        pattern = r"^(what|when|where|who|why|how)\b.*\.$"
+        match = "event" in route.trigger and is_clarifying_question(route.text)
 
-        match = re.search(pattern, route.text, flags=re.IGNORECASE)
-
-        if match and "event" in route.trigger:
+        if match:
             resource = Resource()
             resource.agent_id = route.agent_id
             resource.flow_display_name = route.page.flow.display_name
@@ -111,38 +156,24 @@ class ResponseMessageRules:
             stats.total_issues += 1
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     def run_rm_text_rules(
         self,
         route: Fulfillment,
-        stats: LintStats) -> LintStats:
+        stats: LintStats) -> None:
         """Checks and Executes all Response Message level rules.
 
         This set of rules will be executed against the Response Messages that
         are of type `text`. This is equivalent to the "Agent Says" sections of
         the agent design-time console.
         """
-        voice = False
-
-        if route.agent_type == "voice":
-            voice = True
-
         # Some rules are only appropriate to lint for Voice agents.
         # For example, rules that deal with SSML, DTMF, STT intonation, etc.
-        # We will use the `voice` bool value to filter these rules out for
-        # non-voice agents.
-
-        # closed-choice-alternative
-        if self.disable_map.get("closed-choice-alternative", True) and voice:
-            stats = self.closed_choice_alternative_parser(route, stats)
-
-        # wh-questions
-        if self.disable_map.get("wh-questions", True) and voice:
-            stats = self.wh_questions(route, stats)
-
-        # clarifying-questions
-        if self.disable_map.get("clarifying-questions", True) and voice:
-            stats = self.clarifying_questions(route, stats)
-
-        return stats
+        # All of the current text rules are Voice-only, so they are skipped
+        # entirely for non-voice agents.
+        if (
+            route.agent_type == "voice"
+            and len(route.text) >= MIN_TEXT_LENGTH
+            and route.text[:5].lower().startswith(WH_PREFIXES)
+        ):
+            for rule in self.text_rules:
+                rule(route, stats)
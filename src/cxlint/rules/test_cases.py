@@ -32,9 +32,15 @@ class TestCaseRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        self.naming_enabled = disable_map.get("naming-conventions", True)
+        self.explicit_tps_enabled = disable_map.get(
+            "explicit-tps-in-test-cases", True)
+        self.invalid_intent_enabled = disable_map.get(
+            "invalid-intent-in-test-cases", True)
+
     # naming-conventions
     def test_case_naming_convention(
-        self, tc:TestCase, stats: LintStats) -> LintStats:
+        self, tc:TestCase, stats: LintStats) -> None:
         """Check Test Case Display Name conforms to naming conventions."""
         rule = "R015: Naming Conventions"
 
@@ -56,10 +62,8 @@ class TestCaseRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # explicit-tps-in-test-cases
-    def explicit_tps_in_tcs(self, tc: TestCase, stats: LintStats) -> LintStats:
+    def explicit_tps_in_tcs(self, tc: TestCase, stats: LintStats) -> None:
         """Checks that user utterance is an explicit intent training phrase."""
         rule = "R007: Explicit Training Phrase Not in Test Case"
 
@@ -81,12 +85,10 @@ class TestCaseRules:
                 stats.total_issues += 1
                 self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     # invalid-intent-in-test-cases
     def invalid_intent_in_tcs(
         self, tc: TestCase, stats: LintStats
-    ) -> LintStats:
+    ) -> None:
         """Check that a listed Intent in the Test Case exists in the agent."""
         rule = "R008: Invalid Intent in Test Case"
 
@@ -104,24 +106,20 @@ class TestCaseRules:
         message = ""
         self.log.generic_logger(resource, rule, message)
 
-        return stats
-
-    def run_test_case_rules(self, tc: TestCase, stats: LintStats) -> LintStats:
+    def run_test_case_rules(self, tc: TestCase, stats: LintStats) -> None:
         """Checks and Executes all Test Case level rules."""
         # naming-conventions
-        if self.disable_map.get("naming-conventions", True):
-            stats = self.test_case_naming_convention(tc, stats)
+        if self.naming_enabled:
+            self.test_case_naming_convention(tc, stats)
 
         # explicit-tps-in-test-cases
         if tc.qualified:
-            if self.disable_map.get("explicit-tps-in-test-cases", True):
+            if self.explicit_tps_enabled:
                 stats.total_test_cases += 1
-                stats = self.explicit_tps_in_tcs(tc, stats)
+                self.explicit_tps_in_tcs(tc, stats)
 
         # invalid-intent-in-test-cases
         if tc.has_invalid_intent:
-            if self.disable_map.get("invalid-intent-in-test-cases", True):
+            if self.invalid_intent_enabled:
                 stats.total_test_cases += 1
-                stats = self.invalid_intent_in_tcs(tc, stats)
-
-        return stats
+                self.invalid_intent_in_tcs(tc, stats)
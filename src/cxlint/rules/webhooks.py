@@ -32,9 +32,11 @@ class WebhookRules:
         self.disable_map = disable_map
         self.log = RulesLogger(console=console)
 
+        self.naming_enabled = disable_map.get("naming-conventions", True)
+
     # naming-conventions
     def webhook_naming_conventions(
-        self, webhook: Webhook, stats: LintStats) -> LintStats:
+        self, webhook: Webhook, stats: LintStats) -> None:
         """Check the Webhook Display Name conforms to naming convention."""
         rule = "R015: Naming Conventions"
 
@@ -56,14 +58,10 @@ class WebhookRules:
 
             self.log.generic_logger(resource, rule, message)
 
-        return stats
-
     def run_webhook_rules(
-        self, webhook: Webhook, stats: LintStats) -> LintStats:
+        self, webhook: Webhook, stats: LintStats) -> None:
         """Checks and Executes all Webhook level rules."""
 
         # naming-conventions
-        if self.disable_map.get("naming-conventions", True):
-            stats = self.webhook_naming_conventions(webhook, stats)
-
-        return stats
+        if self.naming_enabled:
+            self.webhook_naming_conventions(webhook, stats)
@@ -0,0 +1,144 @@
+"""Tests for the persistent lint cache."""
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from cxlint.cache import LintCache
+from cxlint.resources.types import LintStats
+
+CONFIG = {"AGENT ID": {"agent_id": "test-agent"}}
+
+
+class FakeConsole:
+    """Collects the messages logged by the cache."""
+
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append(message)
+
+
+class LintCacheTest(unittest.TestCase):
+    """LintCache hits, misses and fallbacks on a temp Flow dir."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = tmp_dir.name
+        self.cache_file = os.path.join(self.tmp_path, "cache", "cache.json")
+        self.flow_path = os.path.join(self.tmp_path, "flows", "Default")
+        self.page_file = os.path.join(self.flow_path, "pages", "Start.json")
+        os.makedirs(os.path.dirname(self.page_file))
+        self.write_page('{"displayName": "Start"}')
+        self.linted = []
+
+    def write_page(self, content: str):
+        with open(self.page_file, "w", encoding="UTF-8") as page_file:
+            page_file.write(content)
+
+    def touch_page(self):
+        stat = os.stat(self.page_file)
+        os.utime(
+            self.page_file,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9),
+        )
+
+    def lint_misses(self, paths):
+        self.linted.append(paths)
+
+        return [
+            (LintStats(total_flows=1, total_issues=2), [f"lint {path}"])
+            for path in paths
+        ]
+
+    def run_lint(self, verbose: bool = False, config=None, cache_file=None):
+        cache = LintCache(
+            "flows",
+            verbose,
+            config or CONFIG,
+            cache_file=cache_file or self.cache_file,
+        )
+        console = FakeConsole()
+        stats = cache.lint_paths([self.flow_path], self.lint_misses, console)
+
+        self.assertEqual(stats.total_flows, 1)
+        self.assertEqual(stats.total_issues, 2)
+        self.assertEqual(console.messages, [f"lint {self.flow_path}"])
+
+        return self.linted.pop()
+
+    def test_unchanged_dir_hits(self):
+        self.assertEqual(self.run_lint(), [self.flow_path])
+        self.assertEqual(self.run_lint(), [])
+
+    def test_mtime_only_change_hits(self):
+        self.run_lint()
+        # The first hit hashes the files for later mtime-only changes
+        self.run_lint()
+        self.touch_page()
+
+        self.assertEqual(self.run_lint(), [])
+        self.assertEqual(self.run_lint(), [])
+
+    def test_content_change_misses(self):
+        self.run_lint()
+        self.run_lint()
+        self.write_page('{"displayName": "Changed"}')
+        self.touch_page()
+
+        self.assertEqual(self.run_lint(), [self.flow_path])
+        self.assertEqual(self.run_lint(), [])
+
+    def test_settings_change_misses(self):
+        self.run_lint()
+        config = {"AGENT ID": {"agent_id": "other-agent"}}
+
+        self.assertEqual(self.run_lint(config=config), [self.flow_path])
+        self.assertEqual(self.run_lint(verbose=True), [self.flow_path])
+        self.assertEqual(self.run_lint(), [])
+
+    def test_corrupt_cache_file_lints(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+
+        with open(self.cache_file, "w", encoding="UTF-8") as cache_file:
+            cache_file.write("{not json")
+
+        self.assertEqual(self.run_lint(), [self.flow_path])
+        self.assertEqual(self.run_lint(), [])
+
+    def test_unwritable_cache_file_lints(self):
+        # A file in place of the cache dir makes every write fail
+        blocker = os.path.join(self.tmp_path, "blocker")
+
+        with open(blocker, "w", encoding="UTF-8"):
+            pass
+
+        cache_file = os.path.join(blocker, "cache.json")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                self.run_lint(cache_file=cache_file), [self.flow_path])
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                self.run_lint(cache_file=cache_file), [self.flow_path])
+
+
+if __name__ == "__main__":
+    unittest.main()